@@ -19,24 +19,32 @@ Features:
 import sys
 import os
 import platform
+import time
 import webbrowser
+from collections import OrderedDict
 from datetime import datetime
+from math import gcd
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QScrollArea, QSizePolicy, QFileDialog, QToolBar,
-    QStatusBar, QToolButton, QFrame, QStyle, QMessageBox, QDialog,
+    QStatusBar, QToolButton, QStyle, QMessageBox, QDialog,
     QFormLayout, QDialogButtonBox, QMenu, QLineEdit, QColorDialog,
-    QSpinBox, QComboBox, QSlider, QProgressBar, QGroupBox
+    QSpinBox, QComboBox, QSlider, QProgressBar, QGroupBox, QTextEdit
 )
 from PySide6.QtGui import (
     QPixmap, QImageReader, QTransform, QIcon, QPalette, QKeySequence,
     QClipboard, QColor, QPainter, QImage, QAction, QActionGroup,
-    QFont, QFontMetrics, QGuiApplication, QTextDocument
+    QFont, QFontMetrics, QGuiApplication,
+    QPen, QBrush, QPixmapCache, QImageIOHandler, QRegion
 )
 from PySide6.QtCore import (
     Qt, QDir, QStandardPaths, QFile, QFileInfo, QSize, QSettings,
-    QDateTime, QEvent, QRect, QPoint, QRectF, QTimer, QTranslator,
-    QLocale, Signal, Slot, QThread, QObject, QSizeF
+    QDateTime, QEvent, QRect, QRectF, QTimer, QTranslator,
+    QLocale, Signal, Slot, QThread, QObject, QSizeF, QRunnable, QThreadPool,
+    QByteArray, QUrl, QSaveFile, QIODevice, QT_TR_NOOP
+)
+from PySide6.QtNetwork import (
+    QNetworkAccessManager, QNetworkRequest, QNetworkReply, QHttpMultiPart, QHttpPart, QSslSocket
 )
 
 # Attempt to import optional dependencies
@@ -48,19 +56,150 @@ except ImportError:
     print("Note: 'send2trash' not available - deletion will be permanent")
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    print("Note: 'requests' not available - background removal disabled")
-
-try:
-    from PIL import Image, ImageQt, ExifTags
+    from PIL import Image, ExifTags
     PILLOW_AVAILABLE = True
 except ImportError:
     PILLOW_AVAILABLE = False
     print("Note: 'Pillow' not available - EXIF metadata and advanced image processing disabled")
 
+# Shared default colors, built once instead of on every startup
+_DEFAULT_BG = QColor(Qt.darkGray)
+_FALLBACK_BG = QColor(Qt.lightGray)
+
+# Writer format for each file extension Save As accepts; anything else is written as PNG
+_EXT_TO_FORMAT = {
+    '.png': 'PNG',
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.bmp': 'BMP',
+    '.tif': 'TIFF',
+    '.tiff': 'TIFF'
+}
+
+
+def _flattened_image(image, color):
+    """Composite an image with transparency over a solid color"""
+    # Premultiplied target lets Qt use its SIMD blend path for the one-off composite
+    flat_image = QImage(image.size(), QImage.Format_ARGB32_Premultiplied)
+    flat_image.fill(color)
+    painter = QPainter(flat_image)
+    painter.drawImage(0, 0, image)
+    painter.end()
+    return flat_image
+
+
+def _premultiplied(image):
+    """Convert an image with alpha to ARGB32_Premultiplied, the format Qt blends fastest"""
+    if image.hasAlphaChannel() and image.format() != QImage.Format_ARGB32_Premultiplied:
+        return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return image
+
+
+def _qimage_from_pil(pil_image):
+    """Convert a Pillow image to a QImage that owns its pixels, in a Qt-native format"""
+    if pil_image.mode == "I;16":
+        # Converting to RGB would clip 16-bit samples; Qt reads them directly
+        data = pil_image.tobytes()
+        image = QImage(data, pil_image.width, pil_image.height, pil_image.width * 2, QImage.Format_Grayscale16)
+        return image.convertToFormat(QImage.Format_RGB32)
+    has_alpha = "A" in pil_image.getbands() or "transparency" in pil_image.info
+    mode = "RGBA" if has_alpha else "RGB"
+    if pil_image.mode != mode:
+        pil_image = pil_image.convert(mode)
+    data = pil_image.tobytes()
+    image = QImage(data, pil_image.width, pil_image.height, pil_image.width * len(mode),
+                   QImage.Format_RGBA8888 if has_alpha else QImage.Format_RGB888)
+    # The conversion copies the pixels out of data, which is freed on return
+    return image.convertToFormat(
+        QImage.Format_ARGB32_Premultiplied if has_alpha else QImage.Format_RGB32)
+
+
+# QIcon.fromTheme walks the theme directories on every call, so look each name up once
+_THEME_ICONS = {}
+
+
+def _themed_icon(name):
+    """Return QIcon.fromTheme(name), cached for the process"""
+    icon = _THEME_ICONS.get(name)
+    if icon is None:
+        icon = _THEME_ICONS[name] = QIcon.fromTheme(name)
+    return icon
+
+
+def _decode_reduction(scale):
+    """Return the power-of-two decode reduction (1, 2, 4 or 8) suited to a display scale"""
+    reduction = 1
+    while reduction < 8 and scale * reduction * 2 <= 1:
+        reduction *= 2
+    return reduction
+
+
+def _limit_decode_size(reader):
+    """Shrink reader's decode by powers of two until it fits Qt's allocation limit.
+
+    Returns the size that will be decoded and the reduction applied to the file's size.
+    """
+    size = reader.size()
+    limit = QImageReader.allocationLimit() * 1024 * 1024
+    if not size.isValid() or limit <= 0:
+        return size, 1
+    reduction = 1
+    while (size.width() // reduction) * (size.height() // reduction) * 4 > limit:
+        reduction *= 2
+    if reduction > 1:
+        size = QSize(max(1, size.width() // reduction), max(1, size.height() // reduction))
+        reader.setScaledSize(size)
+    return size, reduction
+
+
+def _preview_reduction(size, budget):
+    """Return the power-of-two reduction (up to 8) that keeps size at least as large as budget"""
+    if not size.isValid():
+        return 1
+    reduction = 1
+    while (reduction < 8 and size.width() // (reduction * 2) >= budget.width()
+           and size.height() // (reduction * 2) >= budget.height()):
+        reduction *= 2
+    return reduction
+
+
+def _open_reader(path, preview_budget=None):
+    """Open path for a decode within Qt's allocation limit, as a preview when given a budget.
+
+    Returns the reader, the size it will decode, the reduction applied to the file's size
+    and the part of that reduction which is the preview's.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    decoded_size, decode_reduction = _limit_decode_size(reader)
+    preview_reduction = _preview_reduction(decoded_size, preview_budget) if preview_budget else 1
+    if preview_reduction > 1:
+        decoded_size = QSize(decoded_size.width() // preview_reduction,
+                             decoded_size.height() // preview_reduction)
+        reader.setScaledSize(decoded_size)
+        decode_reduction *= preview_reduction
+    return reader, decoded_size, decode_reduction, preview_reduction
+
+
+def _read_reduced(path, decoded_size, reduction):
+    """Decode path at 1/reduction of decoded_size; JPEG does this in its DCT"""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    reader.setScaledSize(QSize(
+        max(1, decoded_size.width() // reduction),
+        max(1, decoded_size.height() // reduction)
+    ))
+    return _premultiplied(reader.read())
+
+
+def _clamp_rect(rect, width, height):
+    """Clip rect in place to a width x height area; the result is invalid if nothing is left"""
+    rect.setLeft(max(0, rect.left()))
+    rect.setTop(max(0, rect.top()))
+    rect.setRight(min(width - 1, rect.right()))
+    rect.setBottom(min(height - 1, rect.bottom()))
+    return rect
+
 
 class WorkerSignals(QObject):
     """Signals for background workers"""
@@ -70,30 +209,217 @@ class WorkerSignals(QObject):
     progress = Signal(int)
 
 
-class RemoveBgWorker(QThread):
-    """Worker thread for remove.bg API calls"""
-    def __init__(self, image_path, api_key):
+class ImagePrefetchTask(QRunnable):
+    """Thread pool task that decodes a neighbouring image ahead of navigation"""
+    def __init__(self, image_path, signals, fit_size=None, preview_budget=None):
         super().__init__()
         self.image_path = image_path
-        self.api_key = api_key
-        self.signals = WorkerSignals()
+        self.signals = signals
+        self.fit_size = fit_size
+        self.preview_budget = preview_budget
 
     def run(self):
         try:
-            with open(self.image_path, 'rb') as img_file:
-                response = requests.post(
-                    'https://api.remove.bg/v1.0/removebg',
-                    files={'image_file': img_file},
-                    data={'size': 'auto'},
-                    headers={'X-Api-Key': self.api_key},
-                    timeout=30
-                )
-                response.raise_for_status()
-                self.signals.result.emit(response.content)
+            mtime = os.path.getmtime(self.image_path)
+            reader, decoded_size, decode_reduction, preview_reduction = _open_reader(
+                self.image_path, self.preview_budget)
+            image = _premultiplied(reader.read())
+            if image.isNull():
+                raise ValueError(reader.errorString())
+            
+            # Also prepare the reduced image a fit to window will display, from the
+            # decode already in memory rather than reading the file a second time
+            reduction, reduced_image = 1, None
+            if self.fit_size and decoded_size.isValid() and not decoded_size.isEmpty():
+                reduction = _decode_reduction(min(
+                    self.fit_size.width() / decoded_size.width(),
+                    self.fit_size.height() / decoded_size.height()
+                ))
+                if reduction > 1:
+                    reduced_image = image.scaled(
+                        max(1, decoded_size.width() // reduction), max(1, decoded_size.height() // reduction),
+                        Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            
+            # QPixmap must be created on the GUI thread, so hand over the QImages
+            self.signals.result.emit((self.image_path, image, mtime, decoded_size, decode_reduction,
+                                      preview_reduction, reduction, reduced_image))
+        except Exception:
+            self.signals.error.emit(self.image_path)
+
+
+def _read_exif_lines(path):
+    """Return the EXIF tags of path as "name: value" strings, empty when there are none"""
+    try:
+        with Image.open(path) as img:
+            exif = img.getexif()
+            if not exif:
+                return []
+            # Same tags the private _getexif() merged: IFD0, the Exif sub-IFD and the GPS block
+            exif_data = dict(exif)
+            exif_data.update(exif.get_ifd(0x8769))
+            if 0x8825 in exif:
+                exif_data[0x8825] = exif.get_ifd(0x8825)
+            tags_get = ExifTags.TAGS.get
+            return [f"{tags_get(tag, tag)}: {value}" for tag, value in exif_data.items()]
+    except Exception as e:
+        print(f"Error reading EXIF data: {e}")
+        return []
+
+
+def _read_full_resolution(path, crop=None):
+    """Decode path at full size, applying crop = (rect, size it was drawn on); null on failure"""
+    # Lift Qt's allocation limit for this one deliberate full-size read
+    limit = QImageReader.allocationLimit()
+    QImageReader.setAllocationLimit(0)
+    try:
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        image = reader.read()
+    finally:
+        QImageReader.setAllocationLimit(limit)
+    if image.isNull():
+        print(f"Error decoding {path} at full resolution: {reader.errorString()}")
+        return image
+        
+    # Apply any crop made on the reduced image at full scale
+    if crop:
+        rect, cropped_from = crop
+        rx = image.width() / cropped_from.width()
+        ry = image.height() / cropped_from.height()
+        image = image.copy(QRect(
+            round(rect.x() * rx), round(rect.y() * ry),
+            max(1, round(rect.width() * rx)), max(1, round(rect.height() * ry))
+        ))
+    return _premultiplied(image)
+
+
+class ClipboardImageTask(QRunnable):
+    """Thread pool task that prepares the full resolution, rotated image for the clipboard"""
+    def __init__(self, request, image, path, crop, angle, signals):
+        super().__init__()
+        self.request = request
+        self.image = image  # None to decode path at full resolution instead
+        self.path = path
+        self.crop = crop
+        self.angle = angle
+        self.signals = signals
+
+    def run(self):
+        image = self.image if self.image is not None else _read_full_resolution(self.path, self.crop)
+        if image.isNull():
+            self.signals.error.emit(self.path or "")
+            return
+        if self.angle % 360:
+            mode = Qt.FastTransformation if self.angle % 90 == 0 else Qt.SmoothTransformation
+            image = image.transformed(QTransform().rotate(self.angle), mode)
+        self.signals.result.emit((self.request, image))
+
+
+class ExifReadTask(QRunnable):
+    """Thread pool task that parses a file's EXIF tags ahead of the properties dialog"""
+    def __init__(self, path, mtime, signals):
+        super().__init__()
+        self.path = path
+        self.mtime = mtime
+        self.signals = signals
+
+    def run(self):
+        self.signals.result.emit((self.path, self.mtime, _read_exif_lines(self.path)))
+
+
+class ImageDecodeTask(QRunnable):
+    """Thread pool task that decodes encoded image bytes into a QImage"""
+    def __init__(self, image_data, tag, signals, background=None):
+        super().__init__()
+        self.image_data = image_data
+        self.tag = tag
+        self.signals = signals
+        self.background = background
+
+    def run(self):
+        image = QImage.fromData(self.image_data)
+        if image.isNull():
+            self.signals.error.emit(self.tag)
+            return
+            
+        # Also prepare the display composite here when a background is given
+        image = _premultiplied(image)
+        flat_image = None
+        if self.background is not None and image.hasAlphaChannel():
+            flat_image = _flattened_image(image, self.background)
+        self.signals.result.emit((self.tag, image, flat_image, self.background))
+
+
+class DirectoryScanner(QObject):
+    """Worker that lists the readable images of a directory off the GUI thread"""
+    partialScanned = Signal(str, list, int, object)
+    scanned = Signal(str, list, int, object)
+
+    # Number of entries delivered early so navigation is usable before the scan ends
+    BATCH_SIZE = 64
+
+    def __init__(self, extensions_provider):
+        super().__init__()
+        # Enumerating image plugins is slow, so it waits for the first scan
+        self._extensions_provider = extensions_provider
+        self.extensions = None
+        self._last_listing = None  # (directory, st_mtime_ns, sorted paths, path -> index) of the last full scan
+
+    @Slot(str)
+    def scan(self, file_path):
+        """Scan the directory of file_path and emit the sorted image list.
+
+        The listing is emitted with the directory mtime it is accurate for (None for partial batches).
+        """
+        if self.extensions is None:
+            self.extensions = self._extensions_provider()
+        directory = os.path.dirname(file_path)
+        
+        # Adding, removing or renaming a file bumps the directory's mtime, so an
+        # unchanged mtime means the last listing is still accurate
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if self._last_listing and self._last_listing[:2] == (directory, mtime_ns):
+            _, _, image_list, positions = self._last_listing
+            self.scanned.emit(file_path, list(image_list), positions.get(file_path, -1), mtime_ns)
+            return
+            
+        entries = []
+        partial_sent = False
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # rpartition is cheaper than splitext; an empty stem means a dotfile or no suffix
+                    stem, _, suffix = entry.name.rpartition('.')
+                    if stem and suffix.lower() in self.extensions and entry.is_file():
+                        entries.append((entry.name.lower(), entry.path))
+                        if not partial_sent and len(entries) >= self.BATCH_SIZE:
+                            self._emit_sorted(self.partialScanned, file_path, entries, None, include_current=True)
+                            partial_sent = True
         except Exception as e:
-            self.signals.error.emit(str(e))
-        finally:
-            self.signals.finished.emit()
+            print(f"Error loading directory images: {e}")
+            mtime_ns = None
+            
+        image_list, positions = self._emit_sorted(self.scanned, file_path, entries, mtime_ns)
+        self._last_listing = (directory, mtime_ns, image_list, positions) if mtime_ns is not None else None
+
+    def _emit_sorted(self, signal, file_path, entries, mtime_ns, include_current=False):
+        """Emit the sorted paths of entries along with the index of file_path.
+
+        Returns the paths and a dict of each path's position in them.
+        """
+        entries = sorted(entries)
+        # Entries come from a normalized directory, so their paths are normalized too
+        image_list = [path for _, path in entries]
+        positions = {path: i for i, path in enumerate(image_list)}
+        if include_current and file_path not in positions:
+            image_list.append(file_path)
+            image_list.sort(key=lambda path: os.path.basename(path).lower())
+            positions = {path: i for i, path in enumerate(image_list)}
+        signal.emit(file_path, list(image_list), positions.get(file_path, -1), mtime_ns)
+        return image_list, positions
 
 
 class ApiKeyDialog(QDialog):
@@ -101,7 +427,7 @@ class ApiKeyDialog(QDialog):
     def __init__(self, current_api_key="", parent=None):
         super().__init__(parent)
         self.setWindowTitle(self.tr("API Key Configuration"))
-        self.setWindowIcon(QIcon.fromTheme("preferences-system"))
+        self.setWindowIcon(_themed_icon("preferences-system"))
         
         layout = QFormLayout(self)
         self.api_key_input = QLineEdit(self)
@@ -146,6 +472,12 @@ class CropOverlay(QWidget):
     cropApplied = Signal()
     cropCancelled = Signal()
 
+    # Cursor for each resize handle, in handle_rects() order
+    HANDLE_CURSORS = (
+        Qt.SizeFDiagCursor, Qt.SizeBDiagCursor, Qt.SizeBDiagCursor, Qt.SizeFDiagCursor,
+        Qt.SizeVerCursor, Qt.SizeHorCursor, Qt.SizeVerCursor, Qt.SizeHorCursor
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
@@ -154,23 +486,40 @@ class CropOverlay(QWidget):
         self.dragging = False
         self.resizing = False
         self.resize_handle_size = 12
+        self._handle_rects = ()
+        self._handle_rects_for = None  # crop_rect that _handle_rects was built for
         self.handle_hover = None
         self.ratio = None
         self.min_crop_size = 20
         self.setFocusPolicy(Qt.StrongFocus)
         self.grid_enabled = False
         self.guide_lines_enabled = True
+        self._overlay_cache = QPixmap()  # Rendered overlay, reused while nothing drawn changes
+        self._overlay_cache_key = None  # Overlay state _overlay_cache was rendered for
+        self._last_painted_key = None  # Overlay state of the last direct paint
         self.setMouseTracking(True)
 
     def set_crop_rect(self, rect):
         """Set the current crop rectangle"""
+        old_rect = self.crop_rect
         self.crop_rect = rect.normalized()
         self.cropChanged.emit(self.crop_rect)
-        self.update()
+        self._update_crop_change(old_rect)
+
+    def _update_crop_change(self, old_rect):
+        """Repaint only the area a crop rectangle change touches"""
+        # Showing or hiding the selection changes the shade of the whole overlay
+        if not old_rect.isValid() or not self.crop_rect.isValid():
+            self.update()
+            return
+        # Handles, border and guides all lie within a handle's size of the rectangle
+        m = self.resize_handle_size
+        self.update(QRegion(old_rect.adjusted(-m, -m, m, m)) | QRegion(self.crop_rect.adjusted(-m, -m, m, m)))
 
     def set_ratio(self, ratio):
         """Set the aspect ratio for cropping (None for free ratio)"""
-        self.ratio = ratio
+        # Plain ints keep the per-mouse-move ratio math in integer arithmetic
+        self.ratio = (int(ratio[0]), int(ratio[1])) if ratio else None
         if self.ratio and not self.crop_rect.isNull():
             self._constrain_to_ratio()
 
@@ -191,7 +540,7 @@ class CropOverlay(QWidget):
             
         w, h = self.ratio
         current_width = self.crop_rect.width()
-        new_height = int(current_width * h / w)
+        new_height = current_width * h // w
         
         # Keep the center point
         center = self.crop_rect.center()
@@ -201,53 +550,75 @@ class CropOverlay(QWidget):
         new_rect.moveCenter(center)
         
         # Ensure the new rect is within bounds
-        bounded_rect = new_rect.intersected(QRect(QPoint(0, 0), self.size()))
-        if not bounded_rect.isNull():
+        bounded_rect = _clamp_rect(new_rect, self.width(), self.height())
+        if bounded_rect.isValid():
+            old_rect = self.crop_rect
             self.crop_rect = bounded_rect
             self.cropChanged.emit(self.crop_rect)
-            self.update()
+            self._update_crop_change(old_rect)
 
-    def handle_positions(self):
-        """Return positions for 8 resize handles (corners and edges)"""
+    def handle_rects(self):
+        """Return rectangles for the 8 resize handles (corners and edges), rebuilt only when the crop changes"""
+        if self._handle_rects_for == self.crop_rect:
+            return self._handle_rects
+            
         r = self.crop_rect
         s = self.resize_handle_size
-        return [
-            r.topLeft(),                                   # Top-left
-            r.topRight() - QPoint(s, 0),                  # Top-right
-            r.bottomLeft() - QPoint(0, s),                # Bottom-left
-            r.bottomRight() - QPoint(s, s),              # Bottom-right
-            QPoint(r.center().x() - s//2, r.top()),      # Top-center
-            QPoint(r.right() - s, r.center().y() - s//2), # Right-center
-            QPoint(r.center().x() - s//2, r.bottom() - s), # Bottom-center
-            QPoint(r.left(), r.center().y() - s//2)       # Left-center
-        ]
-
-    def get_cursor_for_handle(self, handle_idx):
-        """Get appropriate cursor for each resize handle"""
-        if handle_idx in [0, 3]:  # Top-left and bottom-right
-            return Qt.SizeFDiagCursor
-        elif handle_idx in [1, 2]:  # Top-right and bottom-left
-            return Qt.SizeBDiagCursor
-        elif handle_idx in [4, 6]:  # Top-center and bottom-center
-            return Qt.SizeVerCursor
-        elif handle_idx in [5, 7]:  # Right-center and left-center
-            return Qt.SizeHorCursor
-        return Qt.ArrowCursor
+        cx = r.center().x() - s // 2
+        cy = r.center().y() - s // 2
+        self._handle_rects = (
+            QRect(r.left(), r.top(), s, s),               # Top-left
+            QRect(r.right() - s, r.top(), s, s),          # Top-right
+            QRect(r.left(), r.bottom() - s, s, s),        # Bottom-left
+            QRect(r.right() - s, r.bottom() - s, s, s),   # Bottom-right
+            QRect(cx, r.top(), s, s),                     # Top-center
+            QRect(r.right() - s, cy, s, s),               # Right-center
+            QRect(cx, r.bottom() - s, s, s),              # Bottom-center
+            QRect(r.left(), cy, s, s)                     # Left-center
+        )
+        self._handle_rects_for = QRect(r)
+        return self._handle_rects
 
     def paintEvent(self, event):
         """Custom painting of the overlay"""
         if self.crop_rect.isNull():
             return
             
+        # Repaints caused by the image underneath reuse the last rendering;
+        # a state seen for the first time (e.g. mid-drag) is painted directly
+        r = self.crop_rect
+        key = (r.x(), r.y(), r.width(), r.height(), self.width(), self.height(),
+               self.grid_enabled, self.guide_lines_enabled)
+        if key != self._overlay_cache_key and key == self._last_painted_key:
+            self._overlay_cache = QPixmap(self.size() * self.devicePixelRatioF())
+            self._overlay_cache.setDevicePixelRatio(self.devicePixelRatioF())
+            self._overlay_cache.fill(Qt.transparent)
+            cache_painter = QPainter(self._overlay_cache)
+            self._paint_overlay(cache_painter)
+            cache_painter.end()
+            self._overlay_cache_key = key
+            
         painter = QPainter(self)
+        if key == self._overlay_cache_key:
+            painter.drawPixmap(0, 0, self._overlay_cache)
+        else:
+            self._paint_overlay(painter)
+            self._last_painted_key = key
+        painter.end()
+
+    def _paint_overlay(self, painter):
+        """Draw the shade, border, handles, grid and guides"""
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Darken outside crop area
-        outer_path = QPainterPath()
-        outer_path.addRect(QRectF(self.rect()))
-        inner_path = QPainterPath()
-        inner_path.addRect(QRectF(self.crop_rect))
-        painter.fillPath(outer_path - inner_path, QColor(0, 0, 0, 160))
+        # Darken outside crop area with four strips; the rect is axis-aligned,
+        # so no path subtraction is needed
+        r = self.crop_rect
+        width, height = self.width(), self.height()
+        shade = QColor(0, 0, 0, 160)
+        painter.fillRect(0, 0, width, r.top(), shade)
+        painter.fillRect(0, r.bottom() + 1, width, height - r.bottom() - 1, shade)
+        painter.fillRect(0, r.top(), r.left(), r.height(), shade)
+        painter.fillRect(r.right() + 1, r.top(), width - r.right() - 1, r.height(), shade)
         
         # Draw crop border
         border_pen = QPen(QColor(255, 255, 255, 220), 1.5, Qt.DashLine)
@@ -259,9 +630,8 @@ class CropOverlay(QWidget):
         handle_pen = QPen(QColor(0, 0, 0, 150), 1)
         painter.setPen(handle_pen)
         
-        for pos in self.handle_positions():
-            handle_rect = QRect(pos, QSize(self.resize_handle_size, self.resize_handle_size))
-            painter.setBrush(handle_brush)
+        painter.setBrush(handle_brush)
+        for handle_rect in self.handle_rects():
             painter.drawRect(handle_rect)
         
         # Draw grid if enabled
@@ -298,14 +668,14 @@ class CropOverlay(QWidget):
             return
             
         self.handle_hover = None
-        for idx, pos in enumerate(self.handle_positions()):
-            handle_rect = QRect(pos, QSize(self.resize_handle_size, self.resize_handle_size))
-            if handle_rect.contains(event.pos()):
+        pos = event.pos()
+        for idx, handle_rect in enumerate(self.handle_rects()):
+            if handle_rect.contains(pos):
                 self.resizing = True
                 self.handle_hover = idx
-                self.drag_start_pos = event.pos()
+                self.drag_start_pos = pos
                 self.crop_start_rect = QRect(self.crop_rect)
-                self.setCursor(self.get_cursor_for_handle(idx))
+                self.setCursor(self.HANDLE_CURSORS[idx])
                 return
                 
         if self.crop_rect.contains(event.pos()):
@@ -315,18 +685,19 @@ class CropOverlay(QWidget):
             self.setCursor(Qt.SizeAllCursor)
         else:
             # Start new crop
+            old_rect = self.crop_rect
             self.crop_rect = QRect(event.pos(), QSize())
-            self.update()
+            self._update_crop_change(old_rect)
 
     def mouseMoveEvent(self, event):
         """Handle mouse movement for dragging/resizing"""
         if not (self.dragging or self.resizing):
             # Update cursor based on handle hover
             cursor = Qt.ArrowCursor
-            for idx, pos in enumerate(self.handle_positions()):
-                handle_rect = QRect(pos, QSize(self.resize_handle_size, self.resize_handle_size))
-                if handle_rect.contains(event.pos()):
-                    cursor = self.get_cursor_for_handle(idx)
+            pos = event.pos()
+            for idx, handle_rect in enumerate(self.handle_rects()):
+                if handle_rect.contains(pos):
+                    cursor = self.HANDLE_CURSORS[idx]
                     break
             self.setCursor(cursor)
             return
@@ -356,9 +727,9 @@ class CropOverlay(QWidget):
             # Constrain to aspect ratio if set
             if self.ratio:
                 w, h = self.ratio
-                if self.handle_hover in [0, 1, 2, 3]:  # Corner handles
+                if self.handle_hover < 4:  # Corner handles
                     width = rect.width()
-                    height = int(width * h / w)
+                    height = width * h // w
                     
                     if self.handle_hover in [0, 1]:  # Top handles
                         rect.setTop(rect.bottom() - height)
@@ -366,10 +737,10 @@ class CropOverlay(QWidget):
                         rect.setBottom(rect.top() + height)
                 else:  # Edge handles
                     if self.handle_hover in [4, 6]:  # Top or bottom edge
-                        width = int(rect.height() * w / h)
+                        width = rect.height() * w // h
                         rect.setWidth(width)
                     else:  # Left or right edge
-                        height = int(rect.width() * h / w)
+                        height = rect.width() * h // w
                         rect.setHeight(height)
             
             # Ensure minimum size
@@ -386,10 +757,11 @@ class CropOverlay(QWidget):
                     rect.setBottom(rect.top() + self.min_crop_size)
             
             # Ensure rect stays within bounds
-            bounded_rect = rect.intersected(QRect(QPoint(0, 0), self.size()))
-            if not bounded_rect.isNull():
-                self.crop_rect = bounded_rect.normalized()
-                self.update()
+            bounded_rect = _clamp_rect(rect.normalized(), self.width(), self.height())
+            if bounded_rect.isValid():
+                old_rect = self.crop_rect
+                self.crop_rect = bounded_rect
+                self._update_crop_change(old_rect)
                 
         elif self.dragging:
             delta = event.pos() - self.drag_start_pos
@@ -397,10 +769,11 @@ class CropOverlay(QWidget):
             rect.translate(delta)
             
             # Ensure rect stays within bounds
-            bounded_rect = rect.intersected(QRect(QPoint(0, 0), self.size()))
-            if not bounded_rect.isNull():
+            bounded_rect = _clamp_rect(rect, self.width(), self.height())
+            if bounded_rect.isValid():
+                old_rect = self.crop_rect
                 self.crop_rect = bounded_rect
-                self.update()
+                self._update_crop_change(old_rect)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
@@ -440,50 +813,398 @@ class CropOverlay(QWidget):
                 dy = step
                 
             new_rect = self.crop_rect.translated(dx, dy)
-            bounded_rect = new_rect.intersected(QRect(QPoint(0, 0), self.size()))
-            if not bounded_rect.isNull():
+            bounded_rect = _clamp_rect(new_rect, self.width(), self.height())
+            if bounded_rect.isValid():
+                old_rect = self.crop_rect
                 self.crop_rect = bounded_rect
-                self.update()
+                self._update_crop_change(old_rect)
         else:
             super().keyPressEvent(event)
 
 
+class TiledImageWidget(QWidget):
+    """Image surface that only scales and paints the tiles intersecting the exposed area"""
+    TILE_SIZE = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.source_pixmap = QPixmap()
+        self.scale_factor = 1.0
+        self.rotation_angle = 0
+        self.smooth = True
+        self.tiles = {}
+        self.compare_pixmap = QPixmap()  # "Before" image at widget size, drawn left of compare_split
+        self.compare_split = None
+
+    def pixmap(self):
+        """Return the (unscaled, unrotated) pixmap being displayed"""
+        return self.source_pixmap
+
+    def set_pixmap(self, pixmap):
+        """Set the pixmap to display, dropping cached tiles if it changed"""
+        if pixmap.cacheKey() == self.source_pixmap.cacheKey():
+            return
+        self.source_pixmap = pixmap
+        self.tiles.clear()
+        self.update()
+
+    def set_smooth(self, smooth):
+        """Choose smooth or fast tile scaling, repainting when quality goes up"""
+        if smooth == self.smooth:
+            return
+        self.smooth = smooth
+        if smooth:
+            self.update()
+
+    def set_comparison(self, pixmap, split):
+        """Show pixmap left of the x position split, or end the comparison when split is None"""
+        if split is None or pixmap.cacheKey() != self.compare_pixmap.cacheKey() or self.compare_split is None:
+            self.compare_pixmap = pixmap if split is not None else QPixmap()
+            self.compare_split = split
+            self.update()
+            return
+        # Only the strip between the old and new split position changes
+        old_split, self.compare_split = self.compare_split, split
+        if split != old_split:
+            self.update(min(split, old_split), 0, abs(split - old_split), self.height())
+
+    def clear(self):
+        """Remove the displayed pixmap"""
+        self.set_pixmap(QPixmap())
+        self.setFixedSize(1, 1)
+
+    def set_view(self, scale, rotation_angle):
+        """Set the display scale and rotation (multiple of 90°) and resize to match"""
+        self.scale_factor = scale
+        self.rotation_angle = rotation_angle % 360
+        width, height = self._scaled_source_size()
+        if self.rotation_angle % 180 != 0:
+            width, height = height, width
+        self.setFixedSize(width, height)
+        self.update()
+
+    def _scaled_source_size(self):
+        """Return the unrotated size of the source at the current scale"""
+        return (
+            max(1, round(self.source_pixmap.width() * self.scale_factor)),
+            max(1, round(self.source_pixmap.height() * self.scale_factor))
+        )
+
+    def _display_transform(self):
+        """Return the transform from scaled source coordinates to widget coordinates"""
+        scaled_w, scaled_h = self._scaled_source_size()
+        transform = QTransform()
+        transform.translate(self.width() / 2, self.height() / 2)
+        transform.rotate(self.rotation_angle)
+        transform.translate(-scaled_w / 2, -scaled_h / 2)
+        return transform
+
+    def _tile(self, col, row):
+        """Return the source tile at (col, row), cutting it lazily"""
+        tile = self.tiles.get((col, row))
+        if tile is None:
+            ts = self.TILE_SIZE
+            tile = self.source_pixmap.copy(col * ts, row * ts, ts, ts)
+            self.tiles[(col, row)] = tile
+        return tile
+
+    def paintEvent(self, event):
+        """Paint only the tiles that intersect the exposed region"""
+        if self.source_pixmap.isNull():
+            return
+
+        painter = QPainter(self)
+        exposed_rect = event.rect()
+        
+        # In comparison mode the "before" image covers everything left of the split
+        if self.compare_split is not None:
+            split = self.compare_split
+            before_rect = exposed_rect.intersected(QRect(0, 0, split, self.height()))
+            if not before_rect.isEmpty():
+                painter.drawPixmap(before_rect, self.compare_pixmap, before_rect)
+            exposed_rect = exposed_rect.intersected(QRect(split, 0, self.width() - split, self.height()))
+            if exposed_rect.isEmpty():
+                painter.end()
+                return
+            painter.setClipRect(exposed_rect)
+
+        ts = self.TILE_SIZE
+        s = self.scale_factor
+        src_w, src_h = self.source_pixmap.width(), self.source_pixmap.height()
+
+        # Map the exposed widget area back through the rotation to source coordinates
+        transform = self._display_transform()
+        exposed = transform.inverted()[0].mapRect(QRectF(exposed_rect))
+        visible_src_rect = QRectF(
+            exposed.x() / s, exposed.y() / s, exposed.width() / s, exposed.height() / s
+        ).intersected(QRectF(0, 0, src_w, src_h))
+        if visible_src_rect.isEmpty():
+            painter.end()
+            return
+
+        first_col = int(visible_src_rect.left()) // ts
+        last_col = min(int(visible_src_rect.right()) // ts, (src_w - 1) // ts)
+        first_row = int(visible_src_rect.top()) // ts
+        last_row = min(int(visible_src_rect.bottom()) // ts, (src_h - 1) // ts)
+
+        key_prefix = f"tile|{self.source_pixmap.cacheKey()}|{round(s, 3)}|"
+        # Rotation is applied by the painter, so the pixmap itself is never resampled for it
+        painter.setTransform(transform)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                tile = self._tile(col, row)
+                # Round tile edges to whole device pixels so neighbours never leave seams
+                left = round(col * ts * s)
+                top = round(row * ts * s)
+                width = round((col * ts + tile.width()) * s) - left
+                height = round((row * ts + tile.height()) * s) - top
+                if width <= 0 or height <= 0:
+                    continue
+                
+                # Reuse the scaled tile if this zoom level was rendered before;
+                # fast previews are not cached so they never shadow smooth tiles
+                key = f"{key_prefix}{col}|{row}"
+                scaled_tile = QPixmapCache.find(key)
+                if scaled_tile is None and not self.smooth:
+                    scaled_tile = tile.scaled(width, height, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+                elif scaled_tile is None:
+                    scaled_tile = tile.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                    QPixmapCache.insert(key, scaled_tile)
+                painter.drawPixmap(left, top, scaled_tile)
+        painter.end()
+
+
 class ImageViewer(QMainWindow):
     """Main application window for the Professional Image Viewer"""
     
     VERSION = "2.0.0"
     ORGANIZATION = "DigitalVision"
     APPLICATION = "Professional Image Viewer"
+    REMOVE_BG_HOST = "api.remove.bg"
+    
+    # Readable file extensions, filled lazily by _supported_extensions()
+    _SUPPORTED_EXTS = None
+    _SUPPORTED_PATTERNS = None  # The same as "*.ext" file dialog patterns
+    
+    # Resolved action icons by theme name, shared by all windows
+    _ICON_CACHE = {}
     
+    # Style icons used when the icon theme lacks a name
+    STANDARD_ICONS = {
+        "application-exit": QStyle.SP_DialogCloseButton,
+        "dialog-ok-apply": QStyle.SP_DialogApplyButton,
+        "document-open": QStyle.SP_DialogOpenButton,
+        "document-properties": QStyle.SP_FileDialogInfoView,
+        "document-save": QStyle.SP_DialogSaveButton,
+        "document-save-as": QStyle.SP_DialogSaveButton,
+        "edit-clear": QStyle.SP_DialogResetButton,
+        "edit-delete": QStyle.SP_TrashIcon,
+        "go-first": QStyle.SP_MediaSkipBackward,
+        "go-last": QStyle.SP_MediaSkipForward,
+        "go-next": QStyle.SP_ArrowForward,
+        "go-previous": QStyle.SP_ArrowBack,
+        "help-about": QStyle.SP_MessageBoxInformation,
+        "help-contents": QStyle.SP_DialogHelpButton,
+        "media-playback-start": QStyle.SP_MediaPlay,
+        "media-playback-stop": QStyle.SP_MediaStop,
+        "process-stop": QStyle.SP_BrowserStop,
+        "qtlogo": QStyle.SP_TitleBarMenuButton,
+        "view-fullscreen": QStyle.SP_TitleBarMaxButton,
+    }
+    
+    # Number of decoded images kept around the current one
+    PIXMAP_CACHE_MAX = 8
+    PREFETCH_DISTANCE = 2
+    
+    # Files covering the screen this many times over are first shown from a reduced decode
+    PREVIEW_OVERSAMPLE = 2
+    
+    # Number of files whose parsed EXIF tags are kept
+    EXIF_CACHE_MAX = 64
+    
+    # Toolbar/menu actions: (attribute, icon, text, tooltip, shortcut, slot name).
+    # Texts are translated by retranslateUi, which also runs at startup
+    ACTIONS = (
+        ("open_action", "document-open", QT_TR_NOOP("&Open..."),
+         QT_TR_NOOP("Open an image file"), QKeySequence.Open, "open_image_dialog"),
+        ("save_action", "document-save", QT_TR_NOOP("&Save"),
+         QT_TR_NOOP("Save the current image"), QKeySequence.Save, "save_image"),
+        ("save_as_action", "document-save-as", QT_TR_NOOP("Save &As..."),
+         QT_TR_NOOP("Save the current image with a new name"), QKeySequence.SaveAs, "save_image_as"),
+        ("exit_action", "application-exit", QT_TR_NOOP("&Exit"),
+         QT_TR_NOOP("Exit the application"), QKeySequence.Quit, "close"),
+        ("clear_recent_action", "edit-clear", QT_TR_NOOP("Clear Recent Files"),
+         QT_TR_NOOP("Clear recent files list"), None, "clear_recent_files"),
+        ("copy_action", "edit-copy", QT_TR_NOOP("&Copy Image"),
+         QT_TR_NOOP("Copy image to clipboard"), QKeySequence.Copy, "copy_image_to_clipboard"),
+        ("remove_bg_action", "edit-clear", QT_TR_NOOP("Remove &Background"),
+         QT_TR_NOOP("Remove image background using remove.bg"), "Ctrl+B", "process_remove_background"),
+        ("cancel_bg_removal_action", "process-stop", QT_TR_NOOP("Cancel Background Removal"),
+         QT_TR_NOOP("Abort the running background removal"), None, "cancel_bg_removal"),
+        ("delete_action", "edit-delete", QT_TR_NOOP("&Delete Image"),
+         QT_TR_NOOP("Move current image to trash"), QKeySequence.Delete, "delete_current_image"),
+        ("compare_action", "document-edit", QT_TR_NOOP("Compare"),
+         QT_TR_NOOP("Compare original and modified versions"), "Ctrl+C", "toggle_comparison_mode"),
+        ("zoom_in_action", "zoom-in", QT_TR_NOOP("Zoom &In"),
+         QT_TR_NOOP("Zoom in on the image"), QKeySequence.ZoomIn, "zoom_in"),
+        ("zoom_out_action", "zoom-out", QT_TR_NOOP("Zoom &Out"),
+         QT_TR_NOOP("Zoom out from the image"), QKeySequence.ZoomOut, "zoom_out"),
+        ("fit_window_action", "zoom-fit-best", QT_TR_NOOP("&Fit to Window"),
+         QT_TR_NOOP("Fit image to window size"), "F", "fit_to_window"),
+        ("actual_size_action", "zoom-original", QT_TR_NOOP("&Actual Size"),
+         QT_TR_NOOP("View image at 100% scale"), "Ctrl+0", "actual_size"),
+        ("rotate_left_action", "object-rotate-left", QT_TR_NOOP("Rotate &Left"),
+         QT_TR_NOOP("Rotate image 90° counter-clockwise"), "Ctrl+L", "rotate_left"),
+        ("rotate_right_action", "object-rotate-right", QT_TR_NOOP("Rotate &Right"),
+         QT_TR_NOOP("Rotate image 90° clockwise"), "Ctrl+R", "rotate_right"),
+        ("fullscreen_action", "view-fullscreen", QT_TR_NOOP("&Fullscreen"),
+         QT_TR_NOOP("Toggle fullscreen mode"), "F11", "toggle_fullscreen"),
+        ("change_bg_color_action", "preferences-desktop-theme", QT_TR_NOOP("Change &Background Color..."),
+         QT_TR_NOOP("Change viewer background color"), None, "show_change_background_color_dialog"),
+        ("properties_action", "document-properties", QT_TR_NOOP("Image &Properties..."),
+         QT_TR_NOOP("Show image properties"), "Alt+Return", "show_image_properties"),
+        ("prev_action", "go-previous", QT_TR_NOOP("&Previous Image"),
+         QT_TR_NOOP("Go to previous image in folder"), "Left", "prev_image_manual"),
+        ("next_action", "go-next", QT_TR_NOOP("&Next Image"),
+         QT_TR_NOOP("Go to next image in folder"), "Right", "next_image_manual"),
+        ("first_action", "go-first", QT_TR_NOOP("&First Image"),
+         QT_TR_NOOP("Go to first image in folder"), "Home", "first_image"),
+        ("last_action", "go-last", QT_TR_NOOP("&Last Image"),
+         QT_TR_NOOP("Go to last image in folder"), "End", "last_image"),
+        ("set_api_key_action", "configure", QT_TR_NOOP("Set API &Key..."),
+         QT_TR_NOOP("Set remove.bg API key"), None, "show_set_api_key_dialog"),
+        ("crop_mode_action", "transform-crop", QT_TR_NOOP("&Crop Mode"),
+         QT_TR_NOOP("Toggle crop selection mode"), "Ctrl+Shift+C", "toggle_crop_mode"),
+        ("apply_crop_action", "dialog-ok-apply", QT_TR_NOOP("&Apply Crop"),
+         QT_TR_NOOP("Apply the current crop selection"), "Ctrl+Return", "apply_crop_from_selection"),
+        ("slideshow_start_action", "media-playback-start", QT_TR_NOOP("Start &Slideshow"),
+         QT_TR_NOOP("Start slideshow of images in current folder"), "Ctrl+Shift+S", "start_slideshow"),
+        ("slideshow_stop_action", "media-playback-stop", QT_TR_NOOP("Stop Slideshow"),
+         QT_TR_NOOP("Stop the running slideshow"), None, "stop_slideshow"),
+        ("slideshow_settings_action", "configure", QT_TR_NOOP("Slideshow &Settings..."),
+         QT_TR_NOOP("Configure slideshow settings"), None, "show_slideshow_settings"),
+        ("help_action", "help-contents", QT_TR_NOOP("&Help"),
+         QT_TR_NOOP("Show application help"), QKeySequence.HelpContents, "show_help"),
+        ("about_action", "help-about", QT_TR_NOOP("&About"),
+         QT_TR_NOOP("Show about information"), None, "show_about"),
+        ("about_qt_action", "qtlogo", QT_TR_NOOP("About &Qt"),
+         QT_TR_NOOP("Show about Qt information"), None, "show_about_qt"),
+    )
+    
+    # Plain menu actions: (attribute, text); created in their _create_*_actions method
+    ACTION_TEXTS = (
+        ("crop_free_action", QT_TR_NOOP("&Free Crop")),
+        ("crop_1_1_action", QT_TR_NOOP("Crop &1:1 (Square)")),
+        ("crop_4_3_action", QT_TR_NOOP("Crop &4:3")),
+        ("crop_3_2_action", QT_TR_NOOP("Crop &3:2")),
+        ("crop_16_9_action", QT_TR_NOOP("Crop &16:9")),
+        ("crop_custom_action", QT_TR_NOOP("&Custom Ratio...")),
+        ("crop_show_grid_action", QT_TR_NOOP("Show &Grid")),
+        ("crop_show_guides_action", QT_TR_NOOP("Show &Guides")),
+    )
+    
+    # Actions enabled whenever an image is shown, and those that also need other images to move to
+    IMAGE_ACTIONS = (
+        "delete_action", "properties_action", "copy_action",
+        "zoom_in_action", "zoom_out_action", "fit_window_action", "actual_size_action",
+        "rotate_left_action", "rotate_right_action", "crop_mode_action",
+    )
+    NAVIGATION_ACTIONS = ("prev_action", "next_action", "first_action", "last_action", "slideshow_start_action")
+    
+    # Interface languages: (code, name shown in its own language)
+    LANGUAGES = (("en", "English"), ("es", "Español"), ("fr", "Français"))
+
     # Signals
     imageLoaded = Signal(str)
     imageSaved = Signal(str)
     backgroundRemoved = Signal()
+    directoryScanRequested = Signal(str)
     
     def __init__(self, image_path=None):
         super().__init__()
         
         # Initialize application state
         self.current_image_path = None
+        self._current_normpath = ""  # Derived from current_image_path by _set_current_image_path
+        self._current_basename = ""
+        self._current_dirname = ""
         self.current_image_index = -1
         self.image_files_in_directory = []
         self.recent_files = []
+        self._index_by_path = {}  # Position of each path in image_files_in_directory
+        self._indexed_files = None  # Listing that _index_by_path was built for
+        self._listing_key = None  # (directory, st_mtime_ns) the installed listing is accurate for
+        self._unreadable_files = {}  # Normalized path -> mtime of files that failed to load
         self.max_recent_files = 10
         self.scale_factor = 1.0
         self.rotation_angle = 0
         self.initial_image_to_load = image_path
         self.pixmap = QPixmap()
         self.original_pixmap = QPixmap()  # Keep original for comparison
+        self._reader_path = None  # Set while self.pixmap is the unmodified file decode
+        self._reader_mtime = 0.0  # Modification time of _reader_path when it was decoded
+        self._decoded_size = QSize()
+        self._decode_reduction = 1  # >1 when a huge file was decoded below full resolution
+        self._preview_reduction = 1  # Part of _decode_reduction a zoom past the preview can undo
+        self._reader_crop = None  # (rect, uncropped size) when self.pixmap is a crop of the file decode
+        self._effective_scale = 1.0
+        self._displayed_view = None  # (pixmap cacheKey, rotation, scale) last shown by the image widget
+        self._zoom_anchor = None  # (viewport pos, x fraction, y fraction) of a pending wheel zoom
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update_image_display)
+        self._actions_timer = QTimer(self)  # Coalesces update_actions_state calls
+        self._actions_timer.setSingleShot(True)
+        self._actions_timer.setInterval(0)
+        self._actions_timer.timeout.connect(self.update_actions_state)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self.fit_to_window)
+        self._is_interacting = False  # True while updates arrive faster than the debounce
+        self._interaction_timer = QTimer(self)
+        self._interaction_timer.setSingleShot(True)
+        self._interaction_timer.setInterval(120)
+        self._interaction_timer.timeout.connect(self._end_interaction)
+        self._recent_save_timer = QTimer(self)  # Batches recent files writes to QSettings
+        self._recent_save_timer.setSingleShot(True)
+        self._recent_save_timer.setInterval(500)
+        self._recent_save_timer.timeout.connect(self._save_recent_files)
+        self._pixmap_cache = OrderedDict()  # Normalized path -> (pixmap, mtime, decoded size)
+        self._prefetch_pending = set()
+        self._prefetch_signals = WorkerSignals()
+        self._prefetch_signals.result.connect(self._on_image_prefetched)
+        self._prefetch_signals.error.connect(self._on_image_prefetch_failed)
+        self._pending_load = None  # Normalized path whose pool decode should be shown when it lands
+        self._exif_cache = OrderedDict()  # (normalized path, mtime) -> EXIF "name: value" lines
+        self._help_dialog = None  # Created on first show_help, reused until the language changes
+        self._exif_signals = WorkerSignals()
+        self._exif_signals.result.connect(self._on_exif_read)
+        self._clipboard_request = 0  # Bumped per copy so only the latest prepared image is used
+        self._clipboard_signals = WorkerSignals()
+        self._clipboard_signals.result.connect(self._on_clipboard_image_ready)
+        self._clipboard_signals.error.connect(self._on_clipboard_image_failed)
+        self._nam = QNetworkAccessManager(self)
+        self._bg_reply = None
+        self._bg_warmed_at = None  # time.monotonic() of the last remove.bg connection warm-up
+        self._bg_data = QByteArray()  # Response body drained from _bg_reply as it arrives
+        self._bg_decoding = False
+        self._bg_decode_signals = WorkerSignals()
+        self._bg_decode_signals.result.connect(self._on_bg_image_decoded)
+        self._bg_decode_signals.error.connect(self._on_bg_image_decode_failed)
         self.is_fullscreen = False
         self.image_modified_by_bg_removal = False
         self.image_modified_by_crop = False
         self.remove_bg_api_key = ""
-        self.viewer_bg_color = QColor(Qt.darkGray)
+        self.viewer_bg_color = _DEFAULT_BG
         self.slideshow_timer = QTimer(self)
         self.slideshow_interval = 3000  # 3 seconds
         self.is_slideshow_active = False
         self.current_language = "en"
         self.translator = QTranslator()
+        self._translators = {}  # Language code -> loaded QTranslator, so switching back skips the .qm read
         
         # Crop-related state
         self.is_cropping = False
@@ -494,19 +1215,27 @@ class ImageViewer(QMainWindow):
         self.comparison_mode = False
         self.comparison_slider_pos = 50  # 0-100
         
+        # Directory listing runs on its own thread
+        self._scan_thread = QThread(self)
+        self._directory_scanner = DirectoryScanner(self._supported_extensions)
+        self._directory_scanner.moveToThread(self._scan_thread)
+        self.directoryScanRequested.connect(self._directory_scanner.scan)
+        self._directory_scanner.partialScanned.connect(self._on_directory_partially_scanned)
+        self._directory_scanner.scanned.connect(self._on_directory_scanned)
+        self._scan_thread.start()
+        
         # Initialize UI and settings
         self._initialize_application()
         self._load_settings()
         self._setup_ui()
         
-        # Load initial image if provided
-        self._load_initial_image()
+        # Load initial image once the event loop runs, so the window paints before
+        # the image plugins are enumerated and the file is read
+        QTimer.singleShot(0, self._load_initial_image)
         
         # Setup connections
         self.slideshow_timer.timeout.connect(self.next_image_manual)
         self.imageLoaded.connect(self._on_image_loaded)
-        self.imageSaved.connect(self._on_image_saved)
-        self.backgroundRemoved.connect(self._on_background_removed)
 
     def _initialize_application(self):
         """Set application metadata and organization"""
@@ -514,6 +1243,9 @@ class ImageViewer(QMainWindow):
         QApplication.setApplicationName(self.APPLICATION)
         QApplication.setApplicationVersion(self.VERSION)
         
+        # Room for rotated and scaled tile pixmaps (limit is in KB)
+        QPixmapCache.setCacheLimit(256 * 1024)
+        
         # Set default icon theme based on platform
         if platform.system() == "Linux":
             QIcon.setThemeName("breeze")
@@ -530,32 +1262,18 @@ class ImageViewer(QMainWindow):
         
         # Application settings
         self.remove_bg_api_key = settings.value("remove_bg_api_key", "", type=str)
-        self.recent_files = settings.value("recent_files", []) or []
-        # Ensure recent_files is always a list
-        if isinstance(self.recent_files, str):
-            # Split by separator if needed, or wrap in list
-            if self.recent_files.strip() == "":
-                self.recent_files = []
-            else:
-                # Try splitting by common separators
-                if "\n" in self.recent_files:
-                    self.recent_files = [f for f in self.recent_files.splitlines() if f.strip()]
-                elif "," in self.recent_files:
-                    self.recent_files = [f.strip() for f in self.recent_files.split(",") if f.strip()]
-                else:
-                    self.recent_files = [self.recent_files.strip()]
-        elif not isinstance(self.recent_files, list):
-            self.recent_files = list(self.recent_files)
+        # type=list turns the single string INI stores for a one-entry list back into a list
+        self.recent_files = [path for path in settings.value("recent_files", [], type=list) if path]
         self.current_language = settings.value("language", "en", type=str)
         
         # Viewer settings
-        default_bg_color = self.palette().color(QPalette.Window)
-        if not default_bg_color.isValid():
-            default_bg_color = QColor(Qt.lightGray)
-            
-        bg_color_name = settings.value("viewer_background_color", default_bg_color.name(), type=str)
-        loaded_color = QColor(bg_color_name)
-        self.viewer_bg_color = loaded_color if loaded_color.isValid() else default_bg_color
+        bg_color_name = settings.value("viewer_background_color", None, type=str)
+        loaded_color = QColor(bg_color_name) if bg_color_name else QColor()
+        if loaded_color.isValid():
+            self.viewer_bg_color = loaded_color
+        else:
+            default_bg_color = self.palette().color(QPalette.Window)
+            self.viewer_bg_color = default_bg_color if default_bg_color.isValid() else _FALLBACK_BG
         
         # Slideshow settings
         self.slideshow_interval = settings.value("slideshow_interval", 3000, type=int)
@@ -570,6 +1288,7 @@ class ImageViewer(QMainWindow):
         
         # Application settings
         settings.setValue("remove_bg_api_key", self.remove_bg_api_key)
+        self._recent_save_timer.stop()  # Written here along with everything else
         settings.setValue("recent_files", self.recent_files)
         settings.setValue("language", self.current_language)
         
@@ -621,347 +1340,102 @@ class ImageViewer(QMainWindow):
 
     def _setup_image_display(self):
         """Setup the image display components"""
-        # Main image label
-        self.image_label = QLabel()
-        self.image_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
-        self.image_label.setScaledContents(False)
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.installEventFilter(self)
-        
-        # Comparison label (for before/after)
-        self.comparison_label = QLabel()
-        self.comparison_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
-        self.comparison_label.setScaledContents(False)
-        self.comparison_label.setAlignment(Qt.AlignCenter)
-        self.comparison_label.hide()
-        
-        # Container widget for comparison mode
-        self.comparison_container = QWidget()
-        self.comparison_layout = QHBoxLayout(self.comparison_container)
-        self.comparison_layout.setContentsMargins(0, 0, 0, 0)
-        self.comparison_layout.setSpacing(0)
-        self.comparison_layout.addWidget(self.image_label)
-        self.comparison_layout.addWidget(self.comparison_label)
+        # Main image surface (renders only the visible tiles)
+        self.image_widget = TiledImageWidget()
+        self.image_widget.installEventFilter(self)
         
         # Scroll area
         self.scroll_area = QScrollArea(self)
-        self.scroll_area.setWidget(self.image_label)
+        self.scroll_area.setWidget(self.image_widget)
         self.scroll_area.setAlignment(Qt.AlignCenter)
         self.scroll_area.setWidgetResizable(False)
+        self.scroll_area.setAutoFillBackground(True)  # Paints the viewer background color
+        self.scroll_area.viewport().installEventFilter(self)
         self.main_layout.addWidget(self.scroll_area)
         
         # Comparison slider
         self.comparison_slider = QSlider(Qt.Horizontal)
         self.comparison_slider.setRange(0, 100)
         self.comparison_slider.setValue(50)
-        self.comparison_slider.valueChanged.connect(self.update_comparison_view)
+        self.comparison_slider.valueChanged.connect(self._update_comparison_split)
         self.comparison_slider.hide()
         self.main_layout.addWidget(self.comparison_slider)
         
         # Crop overlay
-        self.crop_overlay = CropOverlay(self.image_label)
+        self.crop_overlay = CropOverlay(self.image_widget)
         self.crop_overlay.hide()
         self.crop_overlay.cropApplied.connect(self.apply_crop_from_selection)
-        self.crop_overlay.cropCancelled.connect(lambda: self.toggle_crop_mode(False))
+        self.crop_overlay.cropCancelled.connect(self._cancel_crop_mode)
 
     def _create_actions(self):
         """Create all application actions"""
-        # File actions
-        self._create_file_actions()
-        
-        # Edit actions
-        self._create_edit_actions()
+        # Standard actions come from the ACTIONS table
+        for name, icon_name, _, _, shortcut, slot in self.ACTIONS:
+            setattr(self, name, self._create_action(icon_name, shortcut, getattr(self, slot)))
+        self.remove_bg_action.hovered.connect(self._warm_bg_connection)
+        self.cancel_bg_removal_action.setEnabled(False)
+        self.compare_action.setCheckable(True)
+        self.fullscreen_action.setCheckable(True)
+        self.crop_mode_action.setCheckable(True)
+        self.apply_crop_action.setEnabled(False)
+        self.slideshow_stop_action.setEnabled(False)
         
-        # View actions
-        self._create_view_actions()
+        # Esc has one owner, so a slideshow and a background removal never make it ambiguous.
+        # It is only enabled while one is running, leaving Esc to the crop overlay otherwise
+        self.escape_action = QAction(self)
+        self.escape_action.setShortcut(QKeySequence(Qt.Key_Escape))
+        self.escape_action.setEnabled(False)
+        self.escape_action.triggered.connect(self._on_escape)
+        self.addAction(self.escape_action)
         
-        # Navigate actions
-        self._create_navigate_actions()
+        # Recent file entries are created by _populate_recent_files_menu when the menu opens
         
         # Settings actions
         self._create_settings_actions()
         
         # Crop actions
         self._create_crop_actions()
-        
-        # Slideshow actions
-        self._create_slideshow_actions()
-        
-        # Help actions
-        self._create_help_actions()
-
-    def _create_file_actions(self):
-        """Create file-related actions"""
-        self.open_action = self._create_action(
-            "document-open", 
-            self.tr("&Open..."), 
-            self.tr("Open an image file"),
-            QKeySequence.Open,
-            self.open_image_dialog
-        )
-        
-        self.save_action = self._create_action(
-            "document-save", 
-            self.tr("&Save"), 
-            self.tr("Save the current image"),
-            QKeySequence.Save,
-            self.save_image
-        )
-        
-        self.save_as_action = self._create_action(
-            "document-save-as", 
-            self.tr("Save &As..."), 
-            self.tr("Save the current image with a new name"),
-            QKeySequence.SaveAs,
-            self.save_image_as
-        )
-        
-        self.exit_action = self._create_action(
-            "application-exit", 
-            self.tr("&Exit"), 
-            self.tr("Exit the application"),
-            QKeySequence.Quit,
-            self.close
-        )
-        
-        # Recent files actions (will be populated dynamically)
-        self.recent_file_actions = []
-        for i in range(self.max_recent_files):
-            action = QAction(self, visible=False, triggered=self._open_recent_file)
-            self.recent_file_actions.append(action)
-        
-        self.clear_recent_action = self._create_action(
-            "edit-clear",
-            self.tr("Clear Recent Files"),
-            self.tr("Clear recent files list"),
-            None,
-            self.clear_recent_files
-        )
-
-    def _create_edit_actions(self):
-        """Create edit-related actions"""
-        self.copy_action = self._create_action(
-            "edit-copy", 
-            self.tr("&Copy Image"), 
-            self.tr("Copy image to clipboard"),
-            QKeySequence.Copy,
-            self.copy_image_to_clipboard
-        )
-        
-        self.remove_bg_action = self._create_action(
-            "edit-clear", 
-            self.tr("Remove &Background"), 
-            self.tr("Remove image background using remove.bg"),
-            QKeySequence("Ctrl+B"),
-            self.process_remove_background
-        )
-        
-        self.delete_action = self._create_action(
-            "edit-delete", 
-            self.tr("&Delete Image"), 
-            self.tr("Move current image to trash"),
-            QKeySequence.Delete,
-            self.delete_current_image
-        )
-        
-        self.compare_action = self._create_action(
-            "document-edit",
-            self.tr("Compare"),
-            self.tr("Compare original and modified versions"),
-            QKeySequence("Ctrl+C"),
-            self.toggle_comparison_mode
-        )
-        self.compare_action.setCheckable(True)
-
-    def _create_view_actions(self):
-        """Create view-related actions"""
-        self.zoom_in_action = self._create_action(
-            "zoom-in", 
-            self.tr("Zoom &In"), 
-            self.tr("Zoom in on the image"),
-            QKeySequence.ZoomIn,
-            self.zoom_in
-        )
-        
-        self.zoom_out_action = self._create_action(
-            "zoom-out", 
-            self.tr("Zoom &Out"), 
-            self.tr("Zoom out from the image"),
-            QKeySequence.ZoomOut,
-            self.zoom_out
-        )
-        
-        self.fit_window_action = self._create_action(
-            "zoom-fit-best", 
-            self.tr("&Fit to Window"), 
-            self.tr("Fit image to window size"),
-            QKeySequence("F"),
-            self.fit_to_window
-        )
-        
-        self.actual_size_action = self._create_action(
-            "zoom-original", 
-            self.tr("&Actual Size"), 
-            self.tr("View image at 100% scale"),
-            QKeySequence("Ctrl+0"),
-            self.actual_size
-        )
-        
-        self.rotate_left_action = self._create_action(
-            "object-rotate-left", 
-            self.tr("Rotate &Left"), 
-            self.tr("Rotate image 90° counter-clockwise"),
-            QKeySequence("Ctrl+L"),
-            self.rotate_left
-        )
-        
-        self.rotate_right_action = self._create_action(
-            "object-rotate-right", 
-            self.tr("Rotate &Right"), 
-            self.tr("Rotate image 90° clockwise"),
-            QKeySequence("Ctrl+R"),
-            self.rotate_right
-        )
-        
-        self.fullscreen_action = self._create_action(
-            "view-fullscreen", 
-            self.tr("&Fullscreen"), 
-            self.tr("Toggle fullscreen mode"),
-            QKeySequence("F11"),
-            self.toggle_fullscreen
-        )
-        self.fullscreen_action.setCheckable(True)
-        
-        self.change_bg_color_action = self._create_action(
-            "preferences-desktop-theme", 
-            self.tr("Change &Background Color..."), 
-            self.tr("Change viewer background color"),
-            None,
-            self.show_change_background_color_dialog
-        )
-        
-        self.properties_action = self._create_action(
-            "document-properties", 
-            self.tr("Image &Properties..."), 
-            self.tr("Show image properties"),
-            QKeySequence("Alt+Return"),
-            self.show_image_properties
-        )
-
-    def _create_navigate_actions(self):
-        """Create navigation-related actions"""
-        self.prev_action = self._create_action(
-            "go-previous", 
-            self.tr("&Previous Image"), 
-            self.tr("Go to previous image in folder"),
-            QKeySequence("Left"),
-            self.prev_image_manual
-        )
-        
-        self.next_action = self._create_action(
-            "go-next", 
-            self.tr("&Next Image"), 
-            self.tr("Go to next image in folder"),
-            QKeySequence("Right"),
-            self.next_image_manual
-        )
-        
-        self.first_action = self._create_action(
-            "go-first",
-            self.tr("&First Image"),
-            self.tr("Go to first image in folder"),
-            QKeySequence("Home"),
-            lambda: self.go_to_image(0)
-        )
-        
-        self.last_action = self._create_action(
-            "go-last",
-            self.tr("&Last Image"),
-            self.tr("Go to last image in folder"),
-            QKeySequence("End"),
-            lambda: self.go_to_image(-1)
-        )
 
     def _create_settings_actions(self):
-        """Create settings-related actions"""
-        self.set_api_key_action = self._create_action(
-            "configure", 
-            self.tr("Set API &Key..."), 
-            self.tr("Set remove.bg API key"),
-            None,
-            self.show_set_api_key_dialog
-        )
-        
-        # Language actions
+        """Create the language actions"""
         self.language_group = QActionGroup(self)
+        self._language_actions = {}
+        for code, name in self.LANGUAGES:
+            action = QAction(name, self.language_group)
+            action.setCheckable(True)
+            action.setData(code)
+            self._language_actions[code] = action
+        self._language_actions.get(self.current_language, self._language_actions["en"]).setChecked(True)
         
-        self.language_en_action = QAction("English", self.language_group)
-        self.language_en_action.setCheckable(True)
-        self.language_en_action.triggered.connect(lambda: self.set_language("en"))
-        
-        self.language_es_action = QAction("Español", self.language_group)
-        self.language_es_action.setCheckable(True)
-        self.language_es_action.triggered.connect(lambda: self.set_language("es"))
-        
-        self.language_fr_action = QAction("Français", self.language_group)
-        self.language_fr_action.setCheckable(True)
-        self.language_fr_action.triggered.connect(lambda: self.set_language("fr"))
-        
-        # Set current language
-        if self.current_language == "es":
-            self.language_es_action.setChecked(True)
-        elif self.current_language == "fr":
-            self.language_fr_action.setChecked(True)
-        else:
-            self.language_en_action.setChecked(True)
+        # One group slot reads the language code from the triggered action
+        self.language_group.triggered.connect(self._on_language_triggered)
 
     def _create_crop_actions(self):
-        """Create crop-related actions"""
-        self.crop_mode_action = self._create_action(
-            "transform-crop", 
-            self.tr("&Crop Mode"), 
-            self.tr("Toggle crop selection mode"),
-            QKeySequence("Ctrl+Shift+C"),
-            self.toggle_crop_mode
-        )
-        self.crop_mode_action.setCheckable(True)
-        
-        # Crop ratio actions
-        self.crop_free_action = QAction(self.tr("&Free Crop"), self)
-        self.crop_free_action.setCheckable(True)
-        self.crop_free_action.triggered.connect(lambda: self.set_crop_ratio(None))
-        
-        self.crop_1_1_action = QAction(self.tr("Crop &1:1 (Square)"), self)
-        self.crop_1_1_action.setCheckable(True)
-        self.crop_1_1_action.triggered.connect(lambda: self.set_crop_ratio((1, 1)))
-        
-        self.crop_4_3_action = QAction(self.tr("Crop &4:3"), self)
-        self.crop_4_3_action.setCheckable(True)
-        self.crop_4_3_action.triggered.connect(lambda: self.set_crop_ratio((4, 3)))
-        
-        self.crop_3_2_action = QAction(self.tr("Crop &3:2"), self)
-        self.crop_3_2_action.setCheckable(True)
-        self.crop_3_2_action.triggered.connect(lambda: self.set_crop_ratio((3, 2)))
-        
-        self.crop_16_9_action = QAction(self.tr("Crop &16:9"), self)
-        self.crop_16_9_action.setCheckable(True)
-        self.crop_16_9_action.triggered.connect(lambda: self.set_crop_ratio((16, 9)))
-        
-        self.crop_custom_action = QAction(self.tr("&Custom Ratio..."), self)
+        """Create the crop ratio, grid and guide actions"""
+        # Crop ratio actions carry their ratio as data (None for free crop)
+        self.crop_free_action = QAction(self)
+        self.crop_1_1_action = QAction(self)
+        self.crop_1_1_action.setData((1, 1))
+        self.crop_4_3_action = QAction(self)
+        self.crop_4_3_action.setData((4, 3))
+        self.crop_3_2_action = QAction(self)
+        self.crop_3_2_action.setData((3, 2))
+        self.crop_16_9_action = QAction(self)
+        self.crop_16_9_action.setData((16, 9))
+        
+        self.crop_custom_action = QAction(self)
         self.crop_custom_action.triggered.connect(self.show_custom_ratio_dialog)
         
         # Grid and guides actions
-        self.crop_show_grid_action = QAction(self.tr("Show &Grid"), self)
+        self.crop_show_grid_action = QAction(self)
         self.crop_show_grid_action.setCheckable(True)
         self.crop_show_grid_action.setChecked(False)
-        self.crop_show_grid_action.triggered.connect(
-            lambda: self.crop_overlay.set_grid_enabled(self.crop_show_grid_action.isChecked()))
+        self.crop_show_grid_action.toggled.connect(self.crop_overlay.set_grid_enabled)
         
-        self.crop_show_guides_action = QAction(self.tr("Show &Guides"), self)
+        self.crop_show_guides_action = QAction(self)
         self.crop_show_guides_action.setCheckable(True)
         self.crop_show_guides_action.setChecked(True)
-        self.crop_show_guides_action.triggered.connect(
-            lambda: self.crop_overlay.set_guide_lines_enabled(self.crop_show_guides_action.isChecked()))
+        self.crop_show_guides_action.toggled.connect(self.crop_overlay.set_guide_lines_enabled)
         
         # Group for exclusive checking of crop ratio actions
         self.crop_ratio_group = QActionGroup(self)
@@ -971,101 +1445,73 @@ class ImageViewer(QMainWindow):
         self.crop_ratio_group.addAction(self.crop_3_2_action)
         self.crop_ratio_group.addAction(self.crop_16_9_action)
         self.crop_ratio_group.setExclusive(True)
+        self._crop_ratio_actions = {}
+        for action in self.crop_ratio_group.actions():
+            action.setCheckable(True)
+            self._crop_ratio_actions[action.data()] = action
         self.crop_free_action.setChecked(True)  # Default to free crop
-        
-        self.apply_crop_action = self._create_action(
-            "dialog-ok-apply", 
-            self.tr("&Apply Crop"), 
-            self.tr("Apply the current crop selection"),
-            QKeySequence("Ctrl+Return"),
-            self.apply_crop_from_selection
-        )
-        self.apply_crop_action.setEnabled(False)
-
-    def _create_slideshow_actions(self):
-        """Create slideshow-related actions"""
-        self.slideshow_start_action = self._create_action(
-            "media-playback-start",
-            self.tr("Start &Slideshow"),
-            self.tr("Start slideshow of images in current folder"),
-            QKeySequence("Ctrl+Shift+S"),
-            self.start_slideshow
-        )
-        
-        self.slideshow_stop_action = self._create_action(
-            "media-playback-stop",
-            self.tr("Stop Slideshow"),
-            self.tr("Stop the running slideshow"),
-            QKeySequence("Esc"),
-            self.stop_slideshow
-        )
-        self.slideshow_stop_action.setEnabled(False)
-        
-        self.slideshow_settings_action = self._create_action(
-            "configure",
-            self.tr("Slideshow &Settings..."),
-            self.tr("Configure slideshow settings"),
-            None,
-            self.show_slideshow_settings
-        )
+        self.crop_ratio_group.triggered.connect(self._on_crop_ratio_triggered)
 
-    def _create_help_actions(self):
-        """Create help-related actions"""
-        self.help_action = self._create_action(
-            "help-contents",
-            self.tr("&Help"),
-            self.tr("Show application help"),
-            QKeySequence.HelpContents,
-            self.show_help
-        )
-        
-        self.about_action = self._create_action(
-            "help-about",
-            self.tr("&About"),
-            self.tr("Show about information"),
-            None,
-            self.show_about
-        )
-        
-        self.about_qt_action = self._create_action(
-            "qtlogo",
-            self.tr("About &Qt"),
-            self.tr("Show about Qt information"),
-            None,
-            QApplication.aboutQt
-        )
-
-    def _create_action(self, icon_name, text, tooltip, shortcut, callback):
-        """Helper to create standardized actions"""
+    def _action_icon(self, icon_name):
+        """Return the icon for icon_name, looking each name up in the theme only once"""
+        icon = self._ICON_CACHE.get(icon_name)
+        if icon is not None:
+            return icon
+            
         # Try to get icon from theme, fall back to standard icons
-        icon = QIcon.fromTheme(icon_name)
+        icon = _themed_icon(icon_name)
         if icon.isNull():
             # Try to get a standard pixmap as a fallback
-            standard_icon_enum = getattr(QStyle, f"SP_{icon_name.replace('-', '_').title()}", None)
-            if standard_icon_enum:
+            standard_icon_enum = self.STANDARD_ICONS.get(icon_name)
+            if standard_icon_enum is not None:
                 icon = self.style().standardIcon(standard_icon_enum)
             else:  # Final fallback to a generic icon
-                icon = QIcon.fromTheme("application-x-executable")
+                icon = _themed_icon("application-x-executable")
+        self._ICON_CACHE[icon_name] = icon
+        return icon
 
-        action = QAction(icon, text, self)
-        action.setToolTip(tooltip)
+    def _create_action(self, icon_name, shortcut, callback):
+        """Helper to create standardized actions; retranslateUi sets their texts"""
+        action = QAction(self._action_icon(icon_name), "", self)
         if shortcut:
             action.setShortcut(shortcut)
         action.triggered.connect(callback)
         return action
 
     def _create_menus(self):
-        """Create the application menu bar"""
+        """Create the application menu bar; each menu is filled the first time it opens"""
         menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu(self.tr('&File'))
+        self.file_menu = menubar.addMenu(self.tr('&File'))
+        self.file_menu.aboutToShow.connect(self._populate_file_menu)
+        self.edit_menu = menubar.addMenu(self.tr('&Edit'))
+        self.edit_menu.aboutToShow.connect(self._populate_edit_menu)
+        self.view_menu = menubar.addMenu(self.tr('&View'))
+        self.view_menu.aboutToShow.connect(self._populate_view_menu)
+        self.navigate_menu = menubar.addMenu(self.tr('&Navigate'))
+        self.navigate_menu.aboutToShow.connect(self._populate_navigate_menu)
+        self.settings_menu = menubar.addMenu(self.tr('&Settings'))
+        self.settings_menu.aboutToShow.connect(self._populate_settings_menu)
+        self.help_menu = menubar.addMenu(self.tr('&Help'))
+        self.help_menu.aboutToShow.connect(self._populate_help_menu)
+        
+        # Shortcuts only work for actions added to a widget, so register every
+        # action with the window instead of relying on the (lazy) menus
+        self.addActions([getattr(self, name) for name, *_ in self.ACTIONS])
+        self.addActions([getattr(self, name) for name, _ in self.ACTION_TEXTS])
+
+    def _populate_file_menu(self):
+        """Fill the File menu on first show"""
+        file_menu = self.file_menu
+        if not file_menu.isEmpty():
+            return
         file_menu.addAction(self.open_action)
         file_menu.addAction(self.save_action)
         file_menu.addAction(self.save_as_action)
         
         # Recent files submenu
         self.recent_menu = file_menu.addMenu(self.tr("Open &Recent"))
+        self.recent_menu.aboutToShow.connect(self._populate_recent_files_menu)
+        self.recent_menu.triggered.connect(self._on_recent_file_triggered)
         self.update_recent_files_menu()
         
         file_menu.addSeparator()
@@ -1074,11 +1520,15 @@ class ImageViewer(QMainWindow):
         file_menu.addAction(self.delete_action)
         file_menu.addSeparator()
         file_menu.addAction(self.exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu(self.tr('&Edit'))
+
+    def _populate_edit_menu(self):
+        """Fill the Edit menu on first show"""
+        edit_menu = self.edit_menu
+        if not edit_menu.isEmpty():
+            return
         edit_menu.addAction(self.copy_action)
         edit_menu.addAction(self.remove_bg_action)
+        edit_menu.addAction(self.cancel_bg_removal_action)
         edit_menu.addAction(self.compare_action)
         edit_menu.addSeparator()
         
@@ -1097,9 +1547,12 @@ class ImageViewer(QMainWindow):
         crop_menu.addAction(self.crop_show_guides_action)
         crop_menu.addSeparator()
         crop_menu.addAction(self.apply_crop_action)
-        
-        # View menu
-        view_menu = menubar.addMenu(self.tr('&View'))
+
+    def _populate_view_menu(self):
+        """Fill the View menu on first show"""
+        view_menu = self.view_menu
+        if not view_menu.isEmpty():
+            return
         view_menu.addAction(self.zoom_in_action)
         view_menu.addAction(self.zoom_out_action)
         view_menu.addAction(self.actual_size_action)
@@ -1111,9 +1564,12 @@ class ImageViewer(QMainWindow):
         view_menu.addAction(self.change_bg_color_action)
         view_menu.addSeparator()
         view_menu.addAction(self.fullscreen_action)
-        
-        # Navigate menu
-        navigate_menu = menubar.addMenu(self.tr('&Navigate'))
+
+    def _populate_navigate_menu(self):
+        """Fill the Navigate menu on first show"""
+        navigate_menu = self.navigate_menu
+        if not navigate_menu.isEmpty():
+            return
         navigate_menu.addAction(self.prev_action)
         navigate_menu.addAction(self.next_action)
         navigate_menu.addAction(self.first_action)
@@ -1126,20 +1582,24 @@ class ImageViewer(QMainWindow):
         slideshow_menu.addAction(self.slideshow_stop_action)
         slideshow_menu.addSeparator()
         slideshow_menu.addAction(self.slideshow_settings_action)
-        
-        # Settings menu
-        settings_menu = menubar.addMenu(self.tr('&Settings'))
+
+    def _populate_settings_menu(self):
+        """Fill the Settings menu on first show"""
+        settings_menu = self.settings_menu
+        if not settings_menu.isEmpty():
+            return
         settings_menu.addAction(self.set_api_key_action)
         settings_menu.addSeparator()
         
         # Language submenu
         language_menu = settings_menu.addMenu(self.tr("&Language"))
-        language_menu.addAction(self.language_en_action)
-        language_menu.addAction(self.language_es_action)
-        language_menu.addAction(self.language_fr_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu(self.tr('&Help'))
+        language_menu.addActions(self.language_group.actions())
+
+    def _populate_help_menu(self):
+        """Fill the Help menu on first show"""
+        help_menu = self.help_menu
+        if not help_menu.isEmpty():
+            return
         help_menu.addAction(self.help_action)
         help_menu.addSeparator()
         help_menu.addAction(self.about_action)
@@ -1156,12 +1616,7 @@ class ImageViewer(QMainWindow):
         # Add toolbar to bottom of window
         self.addToolBar(Qt.BottomToolBarArea, self.toolbar)
         
-        # Container widget for better layout control
-        toolbar_container_widget = QWidget()
-        toolbar_layout = QHBoxLayout(toolbar_container_widget)
-        toolbar_layout.setContentsMargins(10, 5, 10, 5)
-        toolbar_layout.setSpacing(8)
-        toolbar_layout.addStretch(1)
+        self.toolbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
         
         # Group actions by function
         file_actions = [self.open_action, self.save_action]
@@ -1175,50 +1630,21 @@ class ImageViewer(QMainWindow):
         slideshow_actions = [self.slideshow_start_action, self.slideshow_stop_action]
         view_actions = [self.change_bg_color_action, self.fullscreen_action]
         
-        # Add action groups to toolbar
-        self._add_actions_to_toolbar(toolbar_layout, file_actions)
-        toolbar_layout.addWidget(self._create_separator())
-        
-        self._add_actions_to_toolbar(toolbar_layout, zoom_actions)
-        toolbar_layout.addWidget(self._create_separator())
-        
-        self._add_actions_to_toolbar(toolbar_layout, navigate_actions)
-        toolbar_layout.addWidget(self._create_separator())
-        
-        self._add_actions_to_toolbar(toolbar_layout, edit_actions)
-        toolbar_layout.addWidget(self._create_separator())
-        
-        self._add_actions_to_toolbar(toolbar_layout, slideshow_actions)
-        toolbar_layout.addWidget(self._create_separator())
-        
-        self._add_actions_to_toolbar(toolbar_layout, view_actions)
-        
-        toolbar_layout.addStretch(1)
-        toolbar_container_widget.setLayout(toolbar_layout)
-        self.toolbar.addWidget(toolbar_container_widget)
-
-    def _add_actions_to_toolbar(self, layout, actions):
-        """Add actions to toolbar with proper buttons"""
-        for action in actions:
-            button = QToolButton()
-            button.setDefaultAction(action)
-            button.setIconSize(self.tool_button_icon_size)
-            # Remove text under icon, show icon only
-            button.setToolButtonStyle(Qt.ToolButtonIconOnly)
-            # Set tooltip with shortcut if available
-            tooltip = action.toolTip()
-            if action.shortcut():
-                tooltip += f" ({action.shortcut().toString()})"
-            button.setToolTip(tooltip)
-            layout.addWidget(button)
-
-    def _create_separator(self):
-        """Create a vertical separator for toolbar"""
-        separator = QFrame()
-        separator.setFrameShape(QFrame.VLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        separator.setMinimumHeight(32)
-        return separator
+        # Add action groups to toolbar, centered between two spacers
+        self.toolbar.addWidget(self._create_toolbar_spacer())
+        action_groups = [file_actions, zoom_actions, navigate_actions,
+                         edit_actions, slideshow_actions, view_actions]
+        for i, actions in enumerate(action_groups):
+            if i:
+                self.toolbar.addSeparator()
+            self.toolbar.addActions(actions)
+        self.toolbar.addWidget(self._create_toolbar_spacer())
+
+    def _create_toolbar_spacer(self):
+        """Create an expanding spacer widget for the toolbar"""
+        spacer = QWidget()
+        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        return spacer
 
     def _load_initial_image(self):
         """Load the initial image if provided"""
@@ -1231,25 +1657,76 @@ class ImageViewer(QMainWindow):
             return
             
         info = QFileInfo(self.initial_image_to_load)
-        supported_formats = [bytes(fmt).decode().lower() 
-                           for fmt in QImageReader.supportedImageFormats()]
-                           
-        if info.suffix().lower() in supported_formats:
-            self.load_image(self.initial_image_to_load)
+        if info.suffix().lower() in self._supported_extensions():
+            self.load_image_async(self.initial_image_to_load)
         else:
             self.status_bar.showMessage(
                 self.tr("Unsupported file format: %s") % self.initial_image_to_load,
                 5000
             )
 
+    @classmethod
+    def _supported_extensions(cls):
+        """Return the set of readable file extensions (without leading dot), computed once"""
+        if cls._SUPPORTED_EXTS is None:
+            cls._SUPPORTED_EXTS = frozenset(
+                bytes(fmt).decode().lower() for fmt in QImageReader.supportedImageFormats()
+            )
+        return cls._SUPPORTED_EXTS
+
+    def load_image_async(self, file_path):
+        """Decode file_path on the thread pool and show it once ready; cached decodes show at once"""
+        path = os.path.normpath(os.path.abspath(file_path))
+        cached = self._pixmap_cache.get(path)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime is None or (cached and cached[1] == mtime):
+            self.load_image(path)
+            return
+            
+        self._pending_load = path
+        self.status_bar.showMessage(self.tr("Loading %s...") % os.path.basename(path))
+        if path not in self._prefetch_pending:
+            self._prefetch_pending.add(path)
+            QThreadPool.globalInstance().start(
+                ImagePrefetchTask(path, self._prefetch_signals, self.scroll_area.size(),
+                                  self._preview_budget()))
+
     def load_image(self, file_path):
         """Load an image from file"""
-        if not os.path.exists(file_path):
+        # A direct load supersedes any decode still pending on the pool
+        self._pending_load = None
+        # One stat both checks existence and dates the cached decode
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
             self.status_bar.showMessage(self.tr("File not found: %s") % file_path, 5000)
             return False
             
-        # Use Pillow if available for better format support and EXIF handling
-        if PILLOW_AVAILABLE:
+        # Use a prefetched decode when the file has not changed since
+        cache_key = os.path.normpath(os.path.abspath(file_path))
+        cached = self._pixmap_cache.get(cache_key)
+        if cached and cached[1] == mtime:
+            self._pixmap_cache.move_to_end(cache_key)
+            new_pixmap, _, decoded_size, decode_reduction, preview_reduction = cached
+            reader_path = file_path
+        else:
+            # Decode with Qt first; the reader applies EXIF orientation itself.
+            # Files beyond Qt's allocation limit are decoded at a reduced size, and files
+            # far larger than the screen start as a preview; zooming in past it loads the
+            # full resolution (see _load_full_resolution)
+            reader, decoded_size, decode_reduction, preview_reduction = _open_reader(
+                file_path, self._preview_budget())
+            new_pixmap = QPixmap.fromImage(_premultiplied(reader.read()))
+            reader_path = file_path if not new_pixmap.isNull() else None
+            if reader_path:
+                self._cache_pixmap(cache_key, new_pixmap, mtime, decoded_size,
+                                   decode_reduction, preview_reduction)
+        
+        # Fall back to Pillow for formats Qt cannot read
+        if new_pixmap.isNull() and PILLOW_AVAILABLE:
             try:
                 pil_image = Image.open(file_path)
                 
@@ -1257,25 +1734,28 @@ class ImageViewer(QMainWindow):
                 pil_image = self._apply_exif_orientation(pil_image)
                 
                 # Convert to QPixmap
-                qimage = ImageQt.ImageQt(pil_image)
-                new_pixmap = QPixmap.fromImage(qimage)
+                new_pixmap = QPixmap.fromImage(_qimage_from_pil(pil_image))
             except Exception as e:
                 print(f"Pillow load error: {e}")
-                # Fall back to Qt if Pillow fails
-                new_pixmap = QPixmap(file_path)
-        else:
-            new_pixmap = QPixmap(file_path)
             
         if new_pixmap.isNull():
+            self._unreadable_files[cache_key] = mtime
             self.status_bar.showMessage(
                 self.tr("Failed to load image: %s") % os.path.basename(file_path),
                 5000
             )
             return False
+        self._unreadable_files.pop(cache_key, None)
             
         self.pixmap = new_pixmap
-        self.original_pixmap = QPixmap(new_pixmap)  # Keep original for comparison
-        self.current_image_path = file_path
+        self.original_pixmap = new_pixmap  # Keep original for comparison; pixmaps are implicitly shared
+        self._set_current_image_path(file_path)
+        self._reader_path = reader_path
+        self._reader_mtime = mtime
+        self._decoded_size = decoded_size
+        self._decode_reduction = decode_reduction if reader_path else 1
+        self._preview_reduction = preview_reduction if reader_path else 1
+        self._reader_crop = None
         
         # Add to recent files
         self._add_to_recent_files(file_path)
@@ -1289,90 +1769,194 @@ class ImageViewer(QMainWindow):
         # Update display and directory listing
         self.fit_to_window()
         self.load_directory_images(self.current_image_path)
-        self.setWindowTitle(f"{os.path.basename(self.current_image_path)} - {self.APPLICATION}")
-        self.update_actions_state()
+        self.setWindowTitle(f"{self._current_basename} - {self.APPLICATION}")
+        self._schedule_actions_update()
         
         # Emit signal
         self.imageLoaded.emit(file_path)
+        self._prefetch_neighbors()
         
         return True
 
+    def _set_current_image_path(self, file_path):
+        """Set the current image path and the name parts derived from it"""
+        self.current_image_path = file_path
+        self._current_normpath = os.path.normpath(os.path.abspath(file_path)) if file_path else ""
+        self._current_basename = os.path.basename(self._current_normpath)
+        self._current_dirname = os.path.dirname(self._current_normpath)
+
+    def _cache_pixmap(self, path, pixmap, mtime, decoded_size, decode_reduction=1, preview_reduction=1):
+        """Add a decoded image to the LRU cache, evicting the oldest entries"""
+        self._pixmap_cache[path] = (pixmap, mtime, decoded_size, decode_reduction, preview_reduction)
+        self._pixmap_cache.move_to_end(path)
+        
+        # Keep the prefetched images within a quarter of the pixmap cache budget
+        budget = QPixmapCache.cacheLimit() * 1024 // 4
+        total = sum(entry[0].width() * entry[0].height() * 4 for entry in self._pixmap_cache.values())
+        while len(self._pixmap_cache) > 1 and (
+                len(self._pixmap_cache) > self.PIXMAP_CACHE_MAX or total > budget):
+            _, (evicted, *_) = self._pixmap_cache.popitem(last=False)
+            total -= evicted.width() * evicted.height() * 4
+
+    def _prefetch_neighbors(self):
+        """Decode the images around the current one on the thread pool"""
+        if self.current_image_index < 0 or not self.image_files_in_directory:
+            return
+            
+        count = len(self.image_files_in_directory)
+        current = self.current_image_index
+        if self.is_slideshow_active:
+            # A slideshow only moves forward and wraps around, so spend the cache on what comes next
+            indices = [(current + distance) % count for distance in range(1, self.PREFETCH_DISTANCE + 1)]
+        else:
+            indices = [index for distance in range(1, self.PREFETCH_DISTANCE + 1)
+                       for index in (current + distance, current - distance) if 0 <= index < count]
+        for index in indices:
+            path = self.image_files_in_directory[index]
+            if index == current or path in self._pixmap_cache or path in self._prefetch_pending:
+                continue
+            self._prefetch_pending.add(path)
+            QThreadPool.globalInstance().start(
+                ImagePrefetchTask(path, self._prefetch_signals, self.scroll_area.size(),
+                                  self._preview_budget()))
+
+    def _on_image_prefetched(self, result):
+        """Convert a prefetched image to a pixmap and cache it"""
+        (path, image, mtime, decoded_size, decode_reduction, preview_reduction,
+         reduction, reduced_image) = result
+        self._prefetch_pending.discard(path)
+        self._cache_pixmap(path, QPixmap.fromImage(image), mtime, decoded_size,
+                           decode_reduction, preview_reduction)
+        if reduced_image is not None and not reduced_image.isNull():
+            QPixmapCache.insert(f"decoded|{path}|{mtime}|{reduction * decode_reduction}",
+                                QPixmap.fromImage(reduced_image))
+        if path == self._pending_load:
+            self.load_image(path)
+
+    def _on_image_prefetch_failed(self, path):
+        """Forget a failed decode; a pending load retries on the GUI thread for the Pillow fallback"""
+        self._prefetch_pending.discard(path)
+        if path == self._pending_load:
+            self.load_image(path)
+
     def _apply_exif_orientation(self, pil_image):
         """Apply EXIF orientation to image if available"""
         if not PILLOW_AVAILABLE:
             return pil_image
             
         try:
-            exif = pil_image._getexif()
-            if exif:
-                orientation = exif.get(274)  # 274 is the orientation tag
+            # getexif() reads only IFD0, which holds the orientation tag (274)
+            orientation = pil_image.getexif().get(274)
+            
+            # Each orientation is a single transpose, so pixels are moved once
+            method = {
+                2: Image.FLIP_LEFT_RIGHT,
+                3: Image.ROTATE_180,
+                4: Image.FLIP_TOP_BOTTOM,
+                5: Image.TRANSPOSE,
+                6: Image.ROTATE_270,
+                7: Image.TRANSVERSE,
+                8: Image.ROTATE_90,
+            }.get(orientation)
+            if method is not None:
+                pil_image = pil_image.transpose(method)
                 
-                if orientation == 2:
-                    pil_image = pil_image.transpose(Image.FLIP_LEFT_RIGHT)
-                elif orientation == 3:
-                    pil_image = pil_image.rotate(180)
-                elif orientation == 4:
-                    pil_image = pil_image.rotate(180).transpose(Image.FLIP_LEFT_RIGHT)
-                elif orientation == 5:
-                    pil_image = pil_image.rotate(-90, expand=True).transpose(Image.FLIP_LEFT_RIGHT)
-                elif orientation == 6:
-                    pil_image = pil_image.rotate(-90, expand=True)
-                elif orientation == 7:
-                    pil_image = pil_image.rotate(90, expand=True).transpose(Image.FLIP_LEFT_RIGHT)
-                elif orientation == 8:
-                    pil_image = pil_image.rotate(90, expand=True)
-                    
         except Exception as e:
             print(f"Error applying EXIF orientation: {e}")
             
         return pil_image
 
     def load_directory_images(self, current_file_path):
-        """Load all images in the current file's directory"""
-        self.image_files_in_directory = []
-        self.current_image_index = -1
-        
+        """Start listing the images in the current file's directory in the background"""
         if not current_file_path or not os.path.exists(current_file_path):
-            self.update_actions_state()
+            self.image_files_in_directory = []
+            self.current_image_index = -1
+            self._schedule_actions_update()
             return
             
-        abs_path = os.path.abspath(current_file_path)
-        directory = os.path.dirname(abs_path)
+        normalized_path = os.path.normpath(os.path.abspath(current_file_path))
+        directory = os.path.dirname(normalized_path)
         
-        if not os.path.isdir(directory):
-            self.update_actions_state()
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.image_files_in_directory = []
+            self.current_image_index = -1
+            self._schedule_actions_update()
             return
             
-        # Get supported formats
-        supported_extensions = [f".{bytes(fmt).decode().lower()}" 
-                              for fmt in QImageReader.supportedImageFormats()]
-        
-        try:
-            # Build sorted list of supported images
-            image_list = []
-            for entry in sorted(os.listdir(directory), key=lambda s: s.lower()):
-                full_path = os.path.join(directory, entry)
-                if os.path.isfile(full_path):
-                    ext = os.path.splitext(full_path)[1].lower()
-                    if ext in supported_extensions:
-                        image_list.append(os.path.normpath(full_path))
+        # Keep the previous listing while the scan runs if it covers this file
+        index = self._directory_index(normalized_path)
+        if index >= 0:
+            self.current_image_index = index
+            # Navigating within a directory that has not changed needs no scan at all
+            if self._listing_key == (directory, mtime_ns):
+                self._schedule_actions_update()
+                return
+        else:
+            self.image_files_in_directory = []
+            self.current_image_index = -1
             
+        self._schedule_actions_update()
+        self.directoryScanRequested.emit(normalized_path)
+
+    def _directory_index(self, path):
+        """Return the position of a normalized path in the directory listing, or -1"""
+        files = self.image_files_in_directory
+        # Rebuild after the listing is replaced or an entry is spliced out
+        if self._indexed_files is not files or len(self._index_by_path) != len(files):
+            self._index_by_path = {file_path: i for i, file_path in enumerate(files)}
+            self._indexed_files = files
+        return self._index_by_path.get(path, -1)
+
+    def _is_current_scan(self, file_path):
+        """Check whether a scan result belongs to the current image's directory"""
+        return bool(self.current_image_path) and self._current_dirname == os.path.dirname(file_path)
+
+    def _apply_directory_listing(self, file_path, image_list, index, mtime_ns=None):
+        """Install a directory listing, re-resolving the index if the user moved on"""
+        # A listing of the same directory at the same mtime is the one already installed;
+        # keeping that list object keeps its path index too
+        key = (os.path.dirname(file_path), mtime_ns) if mtime_ns is not None else None
+        if key is None or key != self._listing_key or not self.image_files_in_directory:
             self.image_files_in_directory = image_list
-            normalized_path = os.path.normpath(abs_path)
-            
-            if normalized_path in self.image_files_in_directory:
-                self.current_image_index = self.image_files_in_directory.index(normalized_path)
-                
-        except Exception as e:
-            print(f"Error loading directory images: {e}")
-            
-        self.update_actions_state()
+            self._listing_key = key
+        current = self._current_normpath
+        if current != file_path or image_list is not self.image_files_in_directory:
+            index = self._directory_index(current)
+        self.current_image_index = index
+        self._schedule_actions_update()
+        self._prefetch_neighbors()
+
+    def _on_directory_partially_scanned(self, file_path, image_list, index, mtime_ns):
+        """Use the first batch of a large directory until the full listing arrives"""
+        if self._is_current_scan(file_path) and not self.image_files_in_directory:
+            self._apply_directory_listing(file_path, image_list, index, mtime_ns)
+
+    def _on_directory_scanned(self, file_path, image_list, index, mtime_ns):
+        """Install the complete directory listing"""
+        if self._is_current_scan(file_path):
+            self._apply_directory_listing(file_path, image_list, index, mtime_ns)
 
     def update_image_display(self):
+        """Schedule a display update, coalescing bursts into one per frame"""
+        # A second request before the first ran means a continuous gesture
+        if self._update_timer.isActive() or self._is_interacting:
+            self._is_interacting = True
+            self._interaction_timer.start()
+        self._update_timer.start()
+
+    def _end_interaction(self):
+        """Render smoothly again once the gesture has settled"""
+        self._is_interacting = False
+        self._do_update_image_display()
+
+    def _do_update_image_display(self):
         """Update the displayed image with current transformations"""
         if self.pixmap.isNull():
-            self.image_label.clear()
-            filename = os.path.basename(self.current_image_path) if self.current_image_path else ""
+            self.image_widget.clear()
+            self._displayed_view = None
+            filename = self._current_basename
             
             if filename and self.status_bar.currentMessage().startswith("Failed to load"):
                 return
@@ -1383,90 +1967,225 @@ class ImageViewer(QMainWindow):
             return
             
         try:
-            # Apply rotation
-            transform = QTransform()
-            transform.rotate(self.rotation_angle)
-            rotated_pixmap = self.pixmap.transformed(transform, Qt.SmoothTransformation)
-            
             # Calculate scale factor with minimum dimension check
+            # (90° rotations only swap width and height, so the unrotated size suffices)
             effective_scale = self.scale_factor
             min_dim = 1  # Minimum dimension after scaling
             
-            target_width = rotated_pixmap.width() * effective_scale
-            target_height = rotated_pixmap.height() * effective_scale
+            target_width = self.pixmap.width() * effective_scale
+            target_height = self.pixmap.height() * effective_scale
             
-            if target_width < min_dim and rotated_pixmap.width() > 0:
-                effective_scale = min_dim / rotated_pixmap.width()
-                
-            if target_height < min_dim and rotated_pixmap.height() > 0:
-                effective_scale = max(effective_scale, min_dim / rotated_pixmap.height())
+            if target_width < min_dim and self.pixmap.width() > 0:
+                effective_scale = min_dim / self.pixmap.width()
                 
-            # Calculate final dimensions
-            new_width = max(min_dim, int(rotated_pixmap.width() * effective_scale))
-            new_height = max(min_dim, int(rotated_pixmap.height() * effective_scale))
-            
-            # Scale the pixmap
-            scaled_pixmap = rotated_pixmap.scaled(
-                new_width, new_height, 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
+            if target_height < min_dim and self.pixmap.height() > 0:
+                effective_scale = max(effective_scale, min_dim / self.pixmap.height())
+            self._effective_scale = effective_scale
+            
+            # Zooming in past a preview's own resolution swaps in the full decode
+            if (self._preview_reduction > 1 and not self._is_interacting
+                    and effective_scale * self.devicePixelRatioF() > 1):
+                if self._load_full_resolution():
+                    effective_scale = self._effective_scale = self.scale_factor
             
-            # Update display
-            self.image_label.setPixmap(scaled_pixmap)
-            self.image_label.adjustSize()
+            # When zoomed well out, display a reduced decode instead of the full image
+            source_pixmap, display_scale = self._reduced_pixmap(effective_scale)
+            
+            # Update display; scaling and rotation happen per visible tile at paint time
+            source_pixmap = self._flattened_pixmap(source_pixmap)
+            self.image_widget.set_smooth(not self._is_interacting)
+            self.image_widget.set_pixmap(source_pixmap)
+            self.image_widget.set_view(display_scale, self.rotation_angle)
+            self._displayed_view = (self.pixmap.cacheKey(), self.rotation_angle, self.scale_factor)
+            if self.is_cropping:
+                self.crop_overlay.setGeometry(self.image_widget.rect())
+            
+            # Keep the image point under the cursor in place after a wheel zoom
+            if self._zoom_anchor:
+                viewport_pos, fx, fy = self._zoom_anchor
+                self._zoom_anchor = None
+                self.scroll_area.horizontalScrollBar().setValue(
+                    round(fx * self.image_widget.width() - viewport_pos.x()))
+                self.scroll_area.verticalScrollBar().setValue(
+                    round(fy * self.image_widget.height() - viewport_pos.y()))
             
             # Update comparison view if active
             if self.comparison_mode:
                 self.update_comparison_view()
             
-            # Update status bar
+            # Update status bar and actions that depend on rotation
             self._update_status_bar()
+            self._schedule_actions_update()
             
         except Exception as e:
             print(f"Error updating image display: {e}")
             self.status_bar.showMessage(self.tr("Error displaying image"))
 
+    def _rotated_pixmap(self, pixmap):
+        """Return pixmap with the current rotation baked in"""
+        if self.rotation_angle % 360 == 0:
+            return pixmap
+            
+        # Quarter turns only move pixels, so fast transformation is exact
+        mode = Qt.FastTransformation if self.rotation_angle % 90 == 0 else Qt.SmoothTransformation
+        return pixmap.transformed(QTransform().rotate(self.rotation_angle), mode)
+
+    def _scaled_rotated_pixmap(self, pixmap, size, aspect_mode):
+        """Return pixmap rotated and smoothly scaled to size, cached per source, angle and size"""
+        scaled_key = (f"scaled|{pixmap.cacheKey()}|{self.rotation_angle}|"
+                      f"{size.width()}x{size.height()}|{int(aspect_mode.value)}")
+        scaled_pixmap = QPixmapCache.find(scaled_key)
+        if scaled_pixmap is None:
+            # Scale the unrotated source first so only the small result gets rotated
+            unrotated_size = size.transposed() if self.rotation_angle % 180 else size
+            scaled_pixmap = pixmap.scaled(unrotated_size, aspect_mode, Qt.SmoothTransformation)
+            if self.rotation_angle:
+                scaled_pixmap = scaled_pixmap.transformed(
+                    QTransform().rotate(self.rotation_angle), Qt.FastTransformation)
+            QPixmapCache.insert(scaled_key, scaled_pixmap)
+        return scaled_pixmap
+
+    def _flattened_pixmap(self, pixmap):
+        """Return pixmap composited once over the viewer background if it has transparency"""
+        if not pixmap.hasAlphaChannel():
+            return pixmap
+            
+        flat_key = f"flattened|{pixmap.cacheKey()}|{self.viewer_bg_color.rgba()}"
+        flat_pixmap = QPixmapCache.find(flat_key)
+        if flat_pixmap is None:
+            flat_pixmap = QPixmap.fromImage(_flattened_image(pixmap.toImage(), self.viewer_bg_color))
+            QPixmapCache.insert(flat_key, flat_pixmap)
+        return flat_pixmap
+
+    def _reduced_pixmap(self, scale):
+        """Return (pixmap, display scale), decoding the file at 1/2, 1/4 or 1/8 size when zoomed out"""
+        if not self._reader_path or scale > 0.5 or not self._decoded_size.isValid():
+            return self.pixmap, scale
+            
+        # Power-of-two reductions map onto the JPEG decoder's DCT scaling
+        reduction = _decode_reduction(scale)
+            
+        # The mtime keeps a decode of an overwritten file from being reused
+        # Keyed on the reduction relative to the file, as previews are already reduced
+        key = f"decoded|{self._reader_path}|{self._reader_mtime}|{reduction * self._decode_reduction}"
+        reduced_pixmap = QPixmapCache.find(key)
+        if reduced_pixmap is None:
+            image = _read_reduced(self._reader_path, self._decoded_size, reduction)
+            if image.isNull():
+                return self.pixmap, scale
+            reduced_pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, reduced_pixmap)
+            
+        # Cut the crop out of the reduced decode instead of rescaling the full-size crop
+        if self._reader_crop:
+            rect, full_size = self._reader_crop
+            rx = reduced_pixmap.width() / full_size.width()
+            ry = reduced_pixmap.height() / full_size.height()
+            reduced_rect = QRect(
+                round(rect.x() * rx), round(rect.y() * ry),
+                max(1, round(rect.width() * rx)), max(1, round(rect.height() * ry))
+            )
+            crop_key = f"{key}|{reduced_rect.x()},{reduced_rect.y()},{reduced_rect.width()},{reduced_rect.height()}"
+            cropped_pixmap = QPixmapCache.find(crop_key)
+            if cropped_pixmap is None:
+                cropped_pixmap = reduced_pixmap.copy(reduced_rect)
+                QPixmapCache.insert(crop_key, cropped_pixmap)
+            reduced_pixmap = cropped_pixmap
+            
+        return reduced_pixmap, scale * self.pixmap.width() / reduced_pixmap.width()
+
+    def _preview_budget(self):
+        """Return the smallest size a preview decode may have: the screen PREVIEW_OVERSAMPLE times over"""
+        screen = self.screen()
+        return screen.size() * (screen.devicePixelRatio() * self.PREVIEW_OVERSAMPLE)
+
+    def _load_full_resolution(self):
+        """Replace a preview decode with the largest decode Qt allows, keeping the view unchanged"""
+        if self._preview_reduction == 1 or not self._reader_path:
+            return False
+        self._preview_reduction = 1
+        
+        reader = QImageReader(self._reader_path)
+        reader.setAutoTransform(True)
+        decoded_size, decode_reduction = _limit_decode_size(reader)
+        image = reader.read()
+        if image.isNull():
+            print(f"Error decoding {self._reader_path} at full resolution: {reader.errorString()}")
+            return False
+        pixmap = QPixmap.fromImage(_premultiplied(image))
+        if not self._reader_crop:
+            self._cache_pixmap(self._current_normpath, pixmap, self._reader_mtime,
+                               decoded_size, decode_reduction)
+                               
+        # Carry a crop made on the preview over to the new decode
+        else:
+            rect, cropped_from = self._reader_crop
+            rx = pixmap.width() / cropped_from.width()
+            ry = pixmap.height() / cropped_from.height()
+            rect = QRect(
+                round(rect.x() * rx), round(rect.y() * ry),
+                max(1, round(rect.width() * rx)), max(1, round(rect.height() * ry))
+            )
+            self._reader_crop = (rect, pixmap.size())
+            pixmap = pixmap.copy(rect)
+            
+        # Rescale so the image keeps its size on screen
+        self.scale_factor *= self.pixmap.width() / pixmap.width()
+        if self.original_pixmap.cacheKey() == self.pixmap.cacheKey():
+            self.original_pixmap = pixmap
+        self.pixmap = pixmap
+        self._decoded_size = decoded_size
+        self._decode_reduction = decode_reduction
+        return True
+
+    def _full_resolution_pixmap(self):
+        """Return self.pixmap at the file's full resolution, decoding it now if it was loaded reduced"""
+        if self._decode_reduction == 1 or not self._reader_path:
+            return self.pixmap
+        image = _read_full_resolution(self._reader_path, self._reader_crop)
+        return self.pixmap if image.isNull() else QPixmap.fromImage(image)
+
     def _update_status_bar(self):
         """Update the status bar with current image information"""
         if self.pixmap.isNull():
             self.status_bar.showMessage(self.tr("No image loaded"))
             return
         
-        img_name = os.path.basename(self.current_image_path) if self.current_image_path else self.tr("Unsaved Image")
+        labels = self._status_labels
+        img_name = self._current_basename or labels["unsaved"]
         
         # Add modification indicators
         mods = []
         if self.image_modified_by_bg_removal:
-            mods.append(self.tr("no bg"))
+            mods.append(labels["no_bg"])
         if self.image_modified_by_crop:
-            mods.append(self.tr("cropped"))
+            mods.append(labels["cropped"])
         
         if mods:
             img_name += f" ({', '.join(mods)})"
             
         # Add modified indicator
-        has_unsaved_changes = (
-            self.rotation_angle != 0 or 
-            self.image_modified_by_bg_removal or 
-            self.image_modified_by_crop
-        )
+        has_unsaved_changes = self._has_unsaved_changes()
         
         modified_indicator = "*" if has_unsaved_changes else ""
         
-        # Compose status message
-        status_msg = (
-            f"{modified_indicator}{img_name} | "
-            f"{self.pixmap.width()}x{self.pixmap.height()} | "
-            f"{self.tr('Zoom')}: {self.scale_factor*100:.0f}% | "
-            f"{self.tr('Rotation')}: {self.rotation_angle}°"
-        )
+        # Compose status message; size and zoom refer to the file, not a reduced decode of it
+        reduction = self._decode_reduction
+        parts = [
+            f"{modified_indicator}{img_name}",
+            f"{self.pixmap.width() * reduction}x{self.pixmap.height() * reduction}",
+            f"{labels['zoom']}: {self.scale_factor / reduction * 100:.0f}%",
+            f"{labels['rotation']}: {self.rotation_angle}°",
+        ]
         
         # Add slideshow info if active
         if self.is_slideshow_active:
-            status_msg += f" | {self.tr('Slideshow')}: {self.slideshow_interval/1000:.1f}s"
+            parts.append(f"{labels['slideshow']}: {self.slideshow_interval/1000:.1f}s")
+        status_msg = " | ".join(parts)
         
-        self.status_bar.showMessage(status_msg)
+        # Most display updates leave the text as it is; skip relaying out the bar then
+        if self.status_bar.currentMessage() != status_msg:
+            self.status_bar.showMessage(status_msg)
 
     def _navigate_image(self, direction):
         """Navigate to next/previous image in directory"""
@@ -1480,14 +2199,10 @@ class ImageViewer(QMainWindow):
             return False
             
         # Check for unsaved changes
-        has_unsaved_changes = (
-            self.rotation_angle != 0 or 
-            self.image_modified_by_bg_removal or 
-            self.image_modified_by_crop
-        )
+        has_unsaved_changes = self._has_unsaved_changes()
         
         if has_unsaved_changes:
-            filename = os.path.basename(self.current_image_path) if self.current_image_path else self.tr("untitled image")
+            filename = self._current_basename or self.tr("untitled image")
             reply = QMessageBox.question(
                 self, 
                 self.tr("Unsaved Changes"), 
@@ -1502,20 +2217,35 @@ class ImageViewer(QMainWindow):
             elif reply == QMessageBox.Cancel:
                 return False
                 
-        # Navigation logic
-        next_index = (self.current_image_index + direction) % num_files
-        
-        # Try to load the next file
+        if self._load_first_readable((self.current_image_index + direction) % num_files, direction):
+            return True
+        self.status_bar.showMessage(self.tr("No other readable images found"), 3000)
+        return False
+
+    def _load_first_readable(self, next_index, direction):
+        """Load the listing entry at next_index, stepping by direction past unreadable files"""
+        num_files = len(self.image_files_in_directory)
         for _ in range(num_files):
             file_to_try = self.image_files_in_directory[next_index]
+            
+            # Skip files that already failed, unless they changed on disk since
+            failed_mtime = self._unreadable_files.get(file_to_try)
+            if failed_mtime is not None:
+                try:
+                    unchanged = os.stat(file_to_try).st_mtime == failed_mtime
+                except OSError:
+                    unchanged = True
+                if unchanged:
+                    next_index = (next_index + direction) % num_files
+                    continue
+                    
             if self.load_image(file_to_try):
+                self.current_image_index = next_index
                 return True
             else:
                 self.status_bar.showMessage(
                     self.tr("Skipping unreadable file: %s") % os.path.basename(file_to_try), 2000)
                 next_index = (next_index + direction) % num_files
-
-        self.status_bar.showMessage(self.tr("No other readable images found"), 3000)
         return False
 
     def go_to_image(self, index):
@@ -1529,6 +2259,14 @@ class ImageViewer(QMainWindow):
         if 0 <= index < len(self.image_files_in_directory):
             self.load_image(self.image_files_in_directory[index])
 
+    def first_image(self):
+        """Navigate to the first image in the folder"""
+        self.go_to_image(0)
+
+    def last_image(self):
+        """Navigate to the last image in the folder"""
+        self.go_to_image(-1)
+
     def open_image_dialog(self):
         """Show open file dialog"""
         settings = QSettings()
@@ -1545,17 +2283,16 @@ class ImageViewer(QMainWindow):
             chosen_dir = QFileInfo(file_name).absolutePath()
             settings.setValue("last_opened_directory", chosen_dir)
             
-            if not self.load_image(file_name):
-                self.current_image_path = None
-                self.current_image_index = -1
-                self.image_files_in_directory = []
-                self.update_actions_state()
+            self.load_image_async(file_name)
 
     def _get_supported_image_formats_filter(self):
         """Get file filter string for supported image formats"""
-        formats = QImageReader.supportedImageFormats()
+        # The patterns never change at runtime; only the labels follow the language
+        cls = type(self)
+        if cls._SUPPORTED_PATTERNS is None:
+            cls._SUPPORTED_PATTERNS = " ".join(f"*.{ext}" for ext in sorted(self._supported_extensions()))
         common_formats = "*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff"
-        all_supported = " ".join([f"*.{bytes(fmt).decode()}" for fmt in formats])
+        all_supported = cls._SUPPORTED_PATTERNS
         return (
             f"{self.tr('Common Image Files')} ({common_formats});;"
             f"{self.tr('All Supported Files')} ({all_supported});;"
@@ -1575,19 +2312,13 @@ class ImageViewer(QMainWindow):
         file_to_save = self.current_image_path
         
         # Apply current rotation to pixmap
-        pixmap_to_save = self.pixmap
-        if self.rotation_angle != 0:
-            transform = QTransform()
-            transform.rotate(self.rotation_angle)
-            pixmap_to_save = pixmap_to_save.transformed(transform, Qt.SmoothTransformation)
+        pixmap_to_save = self._rotated_pixmap(self._full_resolution_pixmap())
         
         # Save directly without merging background
-        if pixmap_to_save.save(file_to_save):
+        if self._write_pixmap(pixmap_to_save, file_to_save):
+            # The saved pixmap is the new state; no need to decode the file again
+            self._adopt_saved_image(file_to_save, pixmap_to_save)
             self.status_bar.showMessage(self.tr("Image saved to %s") % file_to_save, 3000)
-            # Reset state and reload to reflect saved state
-            self.rotation_angle = 0
-            self.image_modified_by_crop = False  # Crop is already applied to self.pixmap
-            self.load_image(file_to_save) 
             self.imageSaved.emit(file_to_save)
             return True
         else:
@@ -1600,36 +2331,25 @@ class ImageViewer(QMainWindow):
         if self.pixmap.isNull():
             return False
             
-        base_path = self.current_image_path or QSettings().value(
-            "last_opened_directory", QDir.homePath())
+        settings = QSettings()
+        base_path = self.current_image_path or settings.value(
+            "last_saved_directory", settings.value("last_opened_directory", QDir.homePath()))
         
         file_name, selected_filter = self._get_save_filename(self.tr("Save Image As"), base_path)
         if not file_name:
             return False
             
         # Determine format from extension
-        ext = os.path.splitext(file_name)[1].lower()
-        format_map = {
-            '.png': 'PNG',
-            '.jpg': 'JPEG',
-            '.jpeg': 'JPEG',
-            '.bmp': 'BMP',
-            '.tif': 'TIFF',
-            '.tiff': 'TIFF'
-        }
-        file_format = format_map.get(ext, 'PNG')
+        file_format = _EXT_TO_FORMAT.get(os.path.splitext(file_name)[1].lower(), 'PNG')
         
         # Apply transformations
-        pixmap_to_save = self.pixmap
-        if self.rotation_angle != 0:
-            transform = QTransform()
-            transform.rotate(self.rotation_angle)
-            pixmap_to_save = pixmap_to_save.transformed(transform, Qt.SmoothTransformation)
+        pixmap_to_save = self._rotated_pixmap(self._full_resolution_pixmap())
             
-        if pixmap_to_save.save(file_name, file_format):
-            self.status_bar.showMessage(self.tr("Image saved to %s") % file_name, 3000)
+        if self._write_pixmap(pixmap_to_save, file_name, file_format):
+            settings.setValue("last_saved_directory", os.path.dirname(file_name))
             # After saving as, the new file becomes the current one
-            self.load_image(file_name) 
+            self._adopt_saved_image(file_name, pixmap_to_save)
+            self.status_bar.showMessage(self.tr("Image saved to %s") % file_name, 3000)
             self.imageSaved.emit(file_name)
             return True
         else:
@@ -1637,13 +2357,61 @@ class ImageViewer(QMainWindow):
             QMessageBox.warning(self, self.tr("Save Error"), self.tr("Could not save image to %s") % file_name)
             return False
 
+    def _write_pixmap(self, pixmap, file_path, file_format=None):
+        """Encode a pixmap into a buffered QSaveFile and commit it atomically"""
+        save_file = QSaveFile(file_path)
+        save_file.setDirectWriteFallback(True)
+        if not save_file.open(QIODevice.WriteOnly):
+            print(f"Error opening {file_path} for writing: {save_file.errorString()}")
+            return False
+        if not pixmap.save(save_file, file_format or QFileInfo(file_path).suffix() or None):
+            save_file.cancelWriting()
+            return False
+        return save_file.commit()
+
+    def _adopt_saved_image(self, file_path, pixmap):
+        """Make a just-saved pixmap the current image without reloading the file"""
+        previous_dirname = self._current_dirname
+        self.pixmap = pixmap
+        self.original_pixmap = pixmap
+        self._set_current_image_path(file_path)
+        self._reader_path = file_path
+        self._reader_mtime = os.path.getmtime(file_path)
+        self._decoded_size = QImageReader(file_path).size()
+        self._decode_reduction = 1
+        self._preview_reduction = 1
+        self._reader_crop = None
+        self.rotation_angle = 0
+        self.image_modified_by_bg_removal = False
+        self.image_modified_by_crop = False
+        self._cache_pixmap(self._current_normpath, pixmap, self._reader_mtime, self._decoded_size)
+        self._add_to_recent_files(file_path)
+        
+        # Only rescan when the file is new to the listing
+        if (self._current_dirname != previous_dirname
+                or self._current_normpath not in self.image_files_in_directory):
+            self.load_directory_images(file_path)
+        self.setWindowTitle(f"{self._current_basename} - {self.APPLICATION}")
+        self._update_timer.stop()
+        self._do_update_image_display()
+        self._schedule_actions_update()
+
     def _get_save_filename(self, purpose, base_path):
         """Get filename for saving with appropriate defaults"""
-        if base_path and os.path.isfile(base_path):
-            original_dir = os.path.dirname(base_path)
-            original_basename, original_ext = os.path.splitext(os.path.basename(base_path))
+        # One QFileInfo answers file/dir/name questions from a single stat
+        info = QFileInfo(base_path) if base_path else QFileInfo()
+        if info.isFile():
+            original_dir = info.absolutePath()
+            original_basename = info.completeBaseName()
+            original_ext = f".{info.suffix()}" if info.suffix() else ""
         else:
-            original_dir = base_path if os.path.isdir(base_path) else QDir.homePath()
+            last_saved_dir = QSettings().value("last_saved_directory", "")
+            if info.isDir():
+                original_dir = base_path
+            elif last_saved_dir and QFileInfo(last_saved_dir).isDir():
+                original_dir = last_saved_dir
+            else:
+                original_dir = QDir.homePath()
             original_basename = "untitled"
             original_ext = ".png"  # Default to png for new files
         
@@ -1690,8 +2458,26 @@ class ImageViewer(QMainWindow):
     def scale_image(self, factor):
         """Scale the image by a factor."""
         self.scale_factor *= factor
+        # Zoom steps come in runs, so draw fast tiles until they stop and then render smoothly
+        self._is_interacting = True
+        self._interaction_timer.start()
         self.update_image_display()
 
+    def _zoom_at(self, viewport_pos, factor):
+        """Scale the image while keeping the point under viewport_pos in place"""
+        if self.pixmap.isNull():
+            return
+            
+        # Remember which fraction of the image is under the cursor; the first
+        # anchor of a burst wins since the widget has not been resized yet
+        if not self._zoom_anchor:
+            widget = self.image_widget
+            fx = min(max((viewport_pos.x() - widget.x()) / max(widget.width(), 1), 0.0), 1.0)
+            fy = min(max((viewport_pos.y() - widget.y()) / max(widget.height(), 1), 0.0), 1.0)
+            self._zoom_anchor = (viewport_pos, fx, fy)
+        
+        self.scale_image(factor)
+
     def fit_to_window(self):
         """Scale image to fit the scroll area."""
         if self.pixmap.isNull():
@@ -1710,13 +2496,22 @@ class ImageViewer(QMainWindow):
         w_ratio = area_size.width() / pixmap_size.width()
         h_ratio = area_size.height() / pixmap_size.height()
         
-        self.scale_factor = min(w_ratio, h_ratio)
+        self._set_scale_factor(min(w_ratio, h_ratio))
+
+    def _set_scale_factor(self, scale):
+        """Apply a new zoom level, skipping the redraw when the view already shows it"""
+        displayed = self._displayed_view
+        if (displayed and displayed[0] == self.pixmap.cacheKey() and displayed[1] == self.rotation_angle
+                and abs(displayed[2] - scale) < 1e-4):
+            self.scale_factor = displayed[2]
+            return
+        self.scale_factor = scale
         self.update_image_display()
 
     def actual_size(self):
         """Display image at its actual size (100% zoom)."""
-        self.scale_factor = 1.0
-        self.update_image_display()
+        self._load_full_resolution()
+        self._set_scale_factor(1.0)
         
     def rotate_left(self):
         """Rotate image 90 degrees counter-clockwise."""
@@ -1754,7 +2549,10 @@ class ImageViewer(QMainWindow):
         palette = self.scroll_area.palette()
         palette.setColor(QPalette.Window, color)
         self.scroll_area.setPalette(palette)
-        self.scroll_area.setAutoFillBackground(True)
+        
+        # Transparent images are pre-composited over the background color
+        if not self.pixmap.isNull() and self.pixmap.hasAlphaChannel():
+            self.update_image_display()
 
     def show_image_properties(self):
         """Show a dialog with image properties."""
@@ -1762,31 +2560,33 @@ class ImageViewer(QMainWindow):
             QMessageBox.information(self, self.tr("Properties"), self.tr("No image loaded."))
             return
 
+        # One cached stat serves every file attribute below
         info = QFileInfo(self.current_image_path)
+        info.setCaching(True)
+        locale = QLocale()
         
         # Basic properties
         properties = [
             f"<b>{self.tr('File')}:</b> {info.fileName()}",
             f"<b>{self.tr('Path')}:</b> {info.absoluteFilePath()}",
             f"<b>{self.tr('Size')}:</b> {self.pixmap.width()} x {self.pixmap.height()} {self.tr('pixels')}",
-            f"<b>{self.tr('File Size')}:</b> {info.size() / 1024:.2f} KB",
-            f"<b>{self.tr('Created')}:</b> {info.birthTime().toString(Qt.DefaultLocaleLongDate)}",
-            f"<b>{self.tr('Modified')}:</b> {info.lastModified().toString(Qt.DefaultLocaleLongDate)}",
+            f"<b>{self.tr('File Size')}:</b> {info.size() >> 10} KB",
+            f"<b>{self.tr('Created')}:</b> {locale.toString(info.birthTime(), QLocale.LongFormat)}",
+            f"<b>{self.tr('Modified')}:</b> {locale.toString(info.lastModified(), QLocale.LongFormat)}",
             f"<b>{self.tr('Depth')}:</b> {self.pixmap.depth()}-bit",
         ]
         
-        # Add EXIF metadata if available
-        if PILLOW_AVAILABLE and self.current_image_path:
-            try:
-                with Image.open(self.current_image_path) as img:
-                    exif_data = img._getexif()
-                    if exif_data:
-                        properties.append("<br><b>EXIF Metadata:</b>")
-                        for tag, value in exif_data.items():
-                            tag_name = ExifTags.TAGS.get(tag, tag)
-                            properties.append(f"&nbsp;&nbsp;{tag_name}: {value}")
-            except Exception as e:
-                print(f"Error reading EXIF data: {e}")
+        # Stored dimensions come from the file header, so edited images need no re-decode
+        file_size = self._image_file_size(self.current_image_path) if self.current_image_path else QSize()
+        if file_size.isValid() and file_size != self.pixmap.size():
+            properties.insert(3, f"<b>{self.tr('File Dimensions')}:</b> "
+                                 f"{file_size.width()} x {file_size.height()} {self.tr('pixels')}")
+        
+        # Add EXIF metadata if available; usually parsed on the thread pool at load time
+        exif_lines = self._exif_lines(self.current_image_path) if self.current_image_path else []
+        if exif_lines:
+            properties.append("<br><b>EXIF Metadata:</b>")
+            properties.extend(f"&nbsp;&nbsp;{line}" for line in exif_lines)
         
         # Create a scrollable dialog for properties
         dialog = QDialog(self)
@@ -1795,13 +2595,10 @@ class ImageViewer(QMainWindow):
         
         layout = QVBoxLayout(dialog)
         
-        text_edit = QTextDocument()
-        text_edit.setHtml("<br>".join(properties))
-        
         scroll_area = QScrollArea()
         content = QLabel()
         content.setTextFormat(Qt.RichText)
-        content.setText(text_edit.toHtml())
+        content.setText("<br>".join(properties))
         content.setWordWrap(True)
         content.setMargin(10)
         
@@ -1816,11 +2613,42 @@ class ImageViewer(QMainWindow):
         
         dialog.exec()
 
+    def _image_file_size(self, file_path):
+        """Return the oriented dimensions of an image file, reading only its header"""
+        reader = QImageReader(file_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            size.transpose()
+        return size
+
     def copy_image_to_clipboard(self):
         """Copy the currently displayed image to the system clipboard."""
-        if not self.pixmap.isNull():
-            QApplication.clipboard().setPixmap(self.image_label.pixmap())
-            self.status_bar.showMessage(self.tr("Image copied to clipboard"), 2000)
+        if self.pixmap.isNull():
+            return
+            
+        # Decoding at full size and rotating can take a while, so do both on the thread pool
+        self._clipboard_request += 1
+        if self._decode_reduction == 1 or not self._reader_path:
+            task = ClipboardImageTask(self._clipboard_request, self.pixmap.toImage(), None, None,
+                                      self.rotation_angle, self._clipboard_signals)
+        else:
+            task = ClipboardImageTask(self._clipboard_request, None, self._reader_path, self._reader_crop,
+                                      self.rotation_angle, self._clipboard_signals)
+        QThreadPool.globalInstance().start(task)
+        self.status_bar.showMessage(self.tr("Copying image to clipboard..."))
+
+    def _on_clipboard_image_ready(self, result):
+        """Put the image prepared by the latest copy on the clipboard"""
+        request, image = result
+        if request != self._clipboard_request:
+            return
+        QApplication.clipboard().setImage(image)
+        self.status_bar.showMessage(self.tr("Image copied to clipboard"), 2000)
+
+    def _on_clipboard_image_failed(self, path):
+        """Report a copy whose full resolution decode failed"""
+        self.status_bar.showMessage(self.tr("Could not copy image to clipboard"), 3000)
 
     def delete_current_image(self):
         """Delete the current image file (moves to trash if available)."""
@@ -1828,48 +2656,51 @@ class ImageViewer(QMainWindow):
             self.status_bar.showMessage(self.tr("No file to delete"), 2000)
             return
 
-        file_name = os.path.basename(self.current_image_path)
+        file_name = self._current_basename
         reply = QMessageBox.question(
             self, self.tr("Confirm Delete"),
             self.tr("Are you sure you want to delete '%s'?") % file_name,
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
 
-        if reply == QMessageBox.Yes:
-            path_to_delete = self.current_image_path
+        if reply != QMessageBox.Yes:
+            return
             
-            # Try to navigate away first
-            if self._navigate_image(1) or self._navigate_image(-1):
-                # Navigation successful, now delete
-                try:
-                    if SEND2TRASH_AVAILABLE:
-                        send2trash.send2trash(path_to_delete)
-                        self.status_bar.showMessage(self.tr("Moved '%s' to trash") % file_name, 3000)
-                    else:
-                        os.remove(path_to_delete)
-                        self.status_bar.showMessage(self.tr("Permanently deleted '%s'") % file_name, 3000)
-                    self.load_directory_images(self.current_image_path)  # Refresh file list
-                except Exception as e:
-                    QMessageBox.warning(self, self.tr("Delete Error"), self.tr("Could not delete file: %s") % e)
-                    self.load_image(path_to_delete)  # Reload if delete failed
+        path_to_delete = self.current_image_path
+        try:
+            if SEND2TRASH_AVAILABLE:
+                send2trash.send2trash(path_to_delete)
+                self.status_bar.showMessage(self.tr("Moved '%s' to trash") % file_name, 3000)
             else:
-                # Could not navigate away, so clear the view after delete
-                try:
-                    if SEND2TRASH_AVAILABLE:
-                        send2trash.send2trash(path_to_delete)
-                    else:
-                        os.remove(path_to_delete)
-                    self.pixmap = QPixmap()
-                    self.current_image_path = None
-                    self.image_files_in_directory = []
-                    self.update_image_display()
-                    self.update_actions_state()
-                except Exception as e:
-                    QMessageBox.warning(self, self.tr("Delete Error"), self.tr("Could not delete file: %s") % e)
+                os.remove(path_to_delete)
+                self.status_bar.showMessage(self.tr("Permanently deleted '%s'") % file_name, 3000)
+        except Exception as e:
+            QMessageBox.warning(self, self.tr("Delete Error"), self.tr("Could not delete file: %s") % e)
+            return
+            
+        # Splice the file out of the listing instead of scanning the directory again
+        deleted_path = self._current_normpath
+        self._pixmap_cache.pop(deleted_path, None)
+        index = self._directory_index(deleted_path)
+        if index >= 0:
+            del self.image_files_in_directory[index]
+            
+        # Show the image that took its place, wrapping to the first and skipping unreadable files
+        if index >= 0 and self.image_files_in_directory:
+            if self._load_first_readable(index % len(self.image_files_in_directory), 1):
+                return
+                
+        self.pixmap = QPixmap()
+        self._reader_path = None
+        self._set_current_image_path(None)
+        self.image_files_in_directory = []
+        self.current_image_index = -1
+        self.update_image_display()
+        self._schedule_actions_update()
 
     def process_remove_background(self):
         """Handle the background removal process."""
-        if self.pixmap.isNull() or not REQUESTS_AVAILABLE:
+        if self.pixmap.isNull() or self._bg_reply is not None or self._bg_decoding:
             return
 
         if not self.remove_bg_api_key:
@@ -1877,37 +2708,148 @@ class ImageViewer(QMainWindow):
                                     self.tr("Please set your remove.bg API key in Settings -> Set API Key..."))
             return
 
+        image_file = QFile(self.current_image_path)
+        if not image_file.open(QFile.ReadOnly):
+            self.status_bar.showMessage(self.tr("Background removal failed."), 5000)
+            return
+
+        # Build the multipart form; the image is streamed from disk
+        multipart = QHttpMultiPart(QHttpMultiPart.FormDataType)
+        image_part = QHttpPart()
+        image_part.setHeader(
+            QNetworkRequest.ContentDispositionHeader,
+            'form-data; name="image_file"; filename="%s"' % self._current_basename
+        )
+        image_part.setHeader(QNetworkRequest.ContentTypeHeader, "application/octet-stream")
+        image_part.setBodyDevice(image_file)
+        image_file.setParent(multipart)
+        multipart.append(image_part)
+        size_part = QHttpPart()
+        size_part.setHeader(QNetworkRequest.ContentDispositionHeader, 'form-data; name="size"')
+        size_part.setBody(b"auto")
+        multipart.append(size_part)
+
+        request = QNetworkRequest(QUrl(f"https://{self.REMOVE_BG_HOST}/v1.0/removebg"))
+        request.setRawHeader(b"X-Api-Key", self.remove_bg_api_key.encode())
+        request.setTransferTimeout(30000)
+
         # Show progress
         self.progress_bar.show()
         self.progress_bar.setValue(0)
-        self.status_bar.showMessage(self.tr("Removing background, please wait..."))
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        
-        # Disable relevant actions during processing
-        self.remove_bg_action.setEnabled(False)
-        self.save_action.setEnabled(False)
-        self.save_as_action.setEnabled(False)
-
-        # Create and start worker thread
-        self.bg_removal_worker = RemoveBgWorker(self.current_image_path, self.remove_bg_api_key)
-        self.bg_removal_worker.signals.result.connect(self._handle_bg_removal_result)
-        self.bg_removal_worker.signals.error.connect(self._handle_bg_removal_error)
-        self.bg_removal_worker.signals.finished.connect(self._handle_bg_removal_finished)
-        self.bg_removal_worker.signals.progress.connect(self.progress_bar.setValue)
-        self.bg_removal_worker.start()
-
-    def _handle_bg_removal_result(self, image_data):
-        """Handle successful background removal result"""
-        new_pixmap = QPixmap()
-        if new_pixmap.loadFromData(image_data):
-            self.pixmap = new_pixmap
-            self.image_modified_by_bg_removal = True
-            self.rotation_angle = 0  # Reset rotation
-            self.update_image_display()
-            self.status_bar.showMessage(self.tr("Background removed successfully. Save the new image."), 5000)
-            self.backgroundRemoved.emit()
+        self.status_bar.showMessage(self.tr("Removing background, please wait... (Esc to cancel)"))
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+
+        # The request runs on the event loop, so the UI stays responsive
+        self._bg_reply = self._nam.post(request, multipart)
+        multipart.setParent(self._bg_reply)
+        self._bg_reply.setProperty("image_path", self.current_image_path)
+        self._bg_reply.uploadProgress.connect(self._on_bg_upload_progress)
+        self._bg_reply.downloadProgress.connect(self._on_bg_download_progress)
+        self._bg_reply.readyRead.connect(self._on_bg_ready_read)
+        self._bg_reply.finished.connect(self._on_bg_removed)
+        self.cancel_bg_removal_action.setEnabled(True)
+        # Saving and a second request wait until this one finishes
+        self.update_actions_state()
+
+    def _warm_bg_connection(self):
+        """Open the TLS connection to remove.bg ahead of a likely request"""
+        if not self.remove_bg_api_key or self._bg_reply is not None or not QSslSocket.supportsSsl():
+            return
+        # Idle connections are dropped after a while, so allow an occasional re-warm
+        now = time.monotonic()
+        if self._bg_warmed_at is not None and now - self._bg_warmed_at < 60:
+            return
+        self._bg_warmed_at = now
+        self._nam.connectToHostEncrypted(self.REMOVE_BG_HOST)
+
+    def _on_bg_upload_progress(self, sent, total):
+        """Show upload progress in the first half of the progress bar"""
+        if total > 0:
+            self.progress_bar.setValue(int(50 * sent / total))
+
+    def _on_bg_download_progress(self, received, total):
+        """Show download progress in the second half of the progress bar"""
+        if total > 0:
+            self.progress_bar.setValue(50 + int(50 * received / total))
+
+    def _on_bg_ready_read(self):
+        """Drain the reply as data arrives so only one copy of the response is held"""
+        if self._bg_data.isEmpty():
+            # Size the buffer once from Content-Length instead of growing it chunk by chunk
+            length = self._bg_reply.header(QNetworkRequest.ContentLengthHeader)
+            if length:
+                self._bg_data.reserve(int(length))
+        self._bg_data.append(self._bg_reply.readAll())
+
+    def _on_escape(self):
+        """Cancel a running background removal, or else stop the slideshow"""
+        if self._bg_reply is not None:
+            self.cancel_bg_removal()
+        elif self.is_slideshow_active:
+            self.stop_slideshow()
+
+    def cancel_bg_removal(self):
+        """Abort a running background removal request"""
+        if self._bg_reply is not None:
+            self._bg_reply.abort()
+
+    def _on_bg_removed(self):
+        """Handle the finished background removal request"""
+        reply = self._bg_reply
+        self._bg_reply = None
+        reply.deleteLater()
+        image_data = self._bg_data
+        if reply.isOpen():
+            image_data.append(reply.readAll())
+        self._bg_data = QByteArray()
+        
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            self.status_bar.showMessage(self.tr("Background removal cancelled."), 5000)
+        elif reply.error() != QNetworkReply.NoError:
+            self._handle_bg_removal_error(reply.errorString())
+        elif reply.property("image_path") != self.current_image_path:
+            self.status_bar.showMessage(self.tr("Background removal discarded: image changed."), 5000)
+        else:
+            # Decode the returned PNG on the thread pool; only the pixmap is built here
+            self._bg_decoding = True
+            QThreadPool.globalInstance().start(
+                ImageDecodeTask(image_data, reply.property("image_path"), self._bg_decode_signals,
+                                QColor(self.viewer_bg_color)))
+            return
+        self._handle_bg_removal_finished()
+
+    def _on_bg_image_decoded(self, result):
+        """Show the decoded background removal result"""
+        image_path, image, flat_image, background = result
+        self._bg_decoding = False
+        if image_path != self.current_image_path:
+            self.status_bar.showMessage(self.tr("Background removal discarded: image changed."), 5000)
         else:
-            raise ValueError(self.tr("Failed to load image from API response."))
+            new_pixmap = QPixmap.fromImage(image)
+            # Seed the flatten cache with the composite built on the worker
+            if flat_image is not None:
+                QPixmapCache.insert(f"flattened|{new_pixmap.cacheKey()}|{background.rgba()}",
+                                    QPixmap.fromImage(flat_image))
+            self._handle_bg_removal_result(new_pixmap)
+        self._handle_bg_removal_finished()
+
+    def _on_bg_image_decode_failed(self, image_path):
+        """Report an API response that could not be decoded"""
+        self._bg_decoding = False
+        self._handle_bg_removal_error(self.tr("Failed to load image from API response."))
+        self._handle_bg_removal_finished()
+
+    def _handle_bg_removal_result(self, new_pixmap):
+        """Handle successful background removal result"""
+        self.pixmap = new_pixmap
+        self._reader_path = None
+        self._decode_reduction = 1
+        self._preview_reduction = 1
+        self.image_modified_by_bg_removal = True
+        self.rotation_angle = 0  # Reset rotation
+        self.update_image_display()
+        self.status_bar.showMessage(self.tr("Background removed successfully. Save the new image."), 5000)
+        self.backgroundRemoved.emit()
 
     def _handle_bg_removal_error(self, error_msg):
         """Handle background removal error"""
@@ -1919,10 +2861,8 @@ class ImageViewer(QMainWindow):
         """Clean up after background removal completes"""
         self.progress_bar.hide()
         QApplication.restoreOverrideCursor()
-        self.remove_bg_action.setEnabled(True)
-        self.save_action.setEnabled(True)
-        self.save_as_action.setEnabled(True)
-        self.update_actions_state()
+        self.cancel_bg_removal_action.setEnabled(False)
+        self._schedule_actions_update()
 
     def show_set_api_key_dialog(self):
         """Show dialog to set the remove.bg API key."""
@@ -1936,14 +2876,19 @@ class ImageViewer(QMainWindow):
         settings = QSettings()
         settings.setValue("remove_bg_api_key", api_key)
         self.remove_bg_api_key = api_key
-        self.update_actions_state()
+        self._schedule_actions_update()
+
+    @Slot()
+    def _cancel_crop_mode(self):
+        """Leave crop mode without applying the selection"""
+        self.toggle_crop_mode(False)
 
     def toggle_crop_mode(self, checked):
         """Toggle cropping mode on or off."""
         self.is_cropping = checked
         if self.is_cropping:
             self.setCursor(Qt.CrossCursor)
-            self.crop_overlay.setGeometry(self.image_label.rect())
+            self.crop_overlay.setGeometry(self.image_widget.rect())
             self.crop_overlay.show()
             self.crop_overlay.set_ratio(self.current_crop_ratio)
             self.crop_overlay.set_crop_rect(QRect())
@@ -1953,24 +2898,26 @@ class ImageViewer(QMainWindow):
             self.setCursor(Qt.ArrowCursor)
             self.crop_overlay.hide()
             self.apply_crop_action.setEnabled(False)
-        self.update_actions_state()
+        self._schedule_actions_update()
 
     def set_crop_ratio(self, ratio):
         """Set the aspect ratio for cropping."""
+        if ratio is not None:
+            # Reduced integer terms keep the drag math in exact integer arithmetic
+            divisor = gcd(*ratio)
+            ratio = (ratio[0] // divisor, ratio[1] // divisor)
         self.current_crop_ratio = ratio
         self.crop_overlay.set_ratio(ratio)
         
         # Update checked state in ratio group
-        if ratio is None:
-            self.crop_free_action.setChecked(True)
-        elif ratio == (1, 1):
-            self.crop_1_1_action.setChecked(True)
-        elif ratio == (4, 3):
-            self.crop_4_3_action.setChecked(True)
-        elif ratio == (3, 2):
-            self.crop_3_2_action.setChecked(True)
-        elif ratio == (16, 9):
-            self.crop_16_9_action.setChecked(True)
+        action = self._crop_ratio_actions.get(ratio)
+        if action:
+            action.setChecked(True)
+
+    @Slot(QAction)
+    def _on_crop_ratio_triggered(self, action):
+        """Apply the ratio stored on the triggered crop ratio action"""
+        self.set_crop_ratio(action.data())
 
     def show_custom_ratio_dialog(self):
         """Show dialog to set a custom crop ratio."""
@@ -1999,25 +2946,32 @@ class ImageViewer(QMainWindow):
             self.set_crop_ratio((width_spin.value(), height_spin.value()))
 
     def eventFilter(self, source, event):
-        """Filter events for mouse interaction on the image label for cropping."""
-        if source is self.image_label and self.is_cropping:
+        """Filter events for wheel zoom and for mouse interaction while cropping."""
+        if (event.type() == QEvent.Wheel and event.modifiers() & Qt.ControlModifier
+                and source is self.scroll_area.viewport()):
+            self._zoom_at(event.position().toPoint(), 1.25 if event.angleDelta().y() > 0 else 0.8)
+            return True
+        if source is self.image_widget and self.is_cropping:
             if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
-                self.crop_origin_point_on_label = event.pos()
-                self.crop_overlay.set_crop_rect(QRect(self.crop_origin_point_on_label, QSize()))
+                pos = event.pos()
+                self.crop_origin_point_on_label = (pos.x(), pos.y())
+                self.crop_overlay.set_crop_rect(QRect(pos, QSize()))
                 self.crop_overlay.show()
                 self.crop_overlay.setFocus()
                 self.apply_crop_action.setEnabled(False)
                 return True
-            elif event.type() == QEvent.MouseMove and self.crop_origin_point_on_label:
-                current_pos = event.pos()
-                rect = QRect(self.crop_origin_point_on_label, current_pos).normalized()
+            elif event.type() == QEvent.MouseMove and self.crop_origin_point_on_label is not None:
+                # Plain integer bounds; no intermediate QRect per mouse move
+                ox, oy = self.crop_origin_point_on_label
+                pos = event.pos()
+                cx, cy = pos.x(), pos.y()
+                width = abs(cx - ox)
+                height = abs(cy - oy)
                 if self.current_crop_ratio:
                     w_ratio, h_ratio = self.current_crop_ratio
-                    width = rect.width()
-                    height = int(width * h_ratio / w_ratio)
-                    rect.setHeight(height)
-                self.crop_overlay.set_crop_rect(rect)
-                self.apply_crop_action.setEnabled(rect.width() > 10 and rect.height() > 10)
+                    height = width * h_ratio // w_ratio
+                self.crop_overlay.set_crop_rect(QRect(min(ox, cx), min(oy, cy), width, height))
+                self._set_action_enabled(self.apply_crop_action, width > 10 and height > 10)
                 return True
             elif event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
                 self.crop_origin_point_on_label = None
@@ -2034,39 +2988,49 @@ class ImageViewer(QMainWindow):
         if crop_rect.isNull() or crop_rect.width() < 10 or crop_rect.height() < 10:
             return
 
-        label_pixmap = self.image_label.pixmap()
-        if label_pixmap.isNull():
+        displayed_pixmap = self.image_widget.pixmap()
+        if displayed_pixmap.isNull():
             return
 
-        # Calculate the position of the pixmap within the label
-        label_w, label_h = self.image_label.width(), self.image_label.height()
-        pixmap_w, pixmap_h = label_pixmap.width(), label_pixmap.height()
-        offset_x = (label_w - pixmap_w) // 2
-        offset_y = (label_h - pixmap_h) // 2
-
-        # Convert crop selection from label coordinates to pixmap coordinates
-        selection_on_pixmap = crop_rect.translated(-offset_x, -offset_y)
-        
-        # Calculate scale factor between original image and displayed pixmap
-        scale = self.pixmap.width() / (label_pixmap.width() / self.scale_factor)
-        
-        # Convert to original image coordinates
-        crop_rect_on_original = QRect(
-            int(selection_on_pixmap.x() * scale),
-            int(selection_on_pixmap.y() * scale),
-            int(selection_on_pixmap.width() * scale),
-            int(selection_on_pixmap.height() * scale)
+        # Convert crop selection from widget coordinates to full-resolution (rotated) pixmap coordinates
+        scale = self._effective_scale
+        selection_on_pixmap = QRectF(
+            crop_rect.x() / scale, crop_rect.y() / scale,
+            crop_rect.width() / scale, crop_rect.height() / scale
         )
+        
+        # Undo the display rotation to get original image coordinates
+        if self.rotation_angle != 0:
+            transform = QTransform()
+            transform.rotate(self.rotation_angle)
+            true_matrix = QPixmap.trueMatrix(transform, self.pixmap.width(), self.pixmap.height())
+            selection_on_pixmap = true_matrix.inverted()[0].mapRect(selection_on_pixmap)
+        crop_rect_on_original = selection_on_pixmap.toRect().intersected(self.pixmap.rect())
+        if crop_rect_on_original.isEmpty():
+            return
+            
+        # A selection covering the whole image leaves nothing to crop or copy
+        if crop_rect_on_original == self.pixmap.rect():
+            self.toggle_crop_mode(False)
+            self.crop_mode_action.setChecked(False)
+            return
 
         # Perform the crop
         cropped_pixmap = self.pixmap.copy(crop_rect_on_original)
         if not cropped_pixmap.isNull():
+            # Track the crop on the file decode so reduced decodes still apply
+            if self._reader_path:
+                if self._reader_crop:
+                    previous_rect, full_size = self._reader_crop
+                    self._reader_crop = (crop_rect_on_original.translated(previous_rect.topLeft()), full_size)
+                else:
+                    self._reader_crop = (crop_rect_on_original, self.pixmap.size())
             self.pixmap = cropped_pixmap
             self.image_modified_by_crop = True
             self.toggle_crop_mode(False)
             self.crop_mode_action.setChecked(False)
             self.fit_to_window()
-            self.update_actions_state()
+            self._schedule_actions_update()
 
     def toggle_comparison_mode(self, checked):
         """Toggle before/after comparison mode."""
@@ -2074,63 +3038,39 @@ class ImageViewer(QMainWindow):
         self.compare_action.setChecked(checked)
         
         if checked:
-            # Setup comparison view
-            self.scroll_area.takeWidget()
-            self.scroll_area.setWidget(self.comparison_container)
-            self.comparison_label.show()
+            # The image widget draws the "before" side itself
             self.comparison_slider.show()
             self.update_comparison_view()
         else:
-            # Restore normal view
-            self.scroll_area.takeWidget()
-            self.scroll_area.setWidget(self.image_label)
-            self.comparison_label.hide()
+            self.image_widget.set_comparison(QPixmap(), None)
             self.comparison_slider.hide()
         
-        self.update_actions_state()
+        self._schedule_actions_update()
 
     def update_comparison_view(self):
         """Update the comparison view based on slider position."""
         if not self.comparison_mode or self.pixmap.isNull():
             return
             
-        # Get current displayed pixmap (with transformations)
-        current_pixmap = self.image_label.pixmap()
-        if current_pixmap.isNull():
-            return
-            
-        # Get original pixmap (with same transformations)
-        transform = QTransform()
-        transform.rotate(self.rotation_angle)
-        original_pixmap = self.original_pixmap.transformed(transform, Qt.SmoothTransformation)
-        original_pixmap = original_pixmap.scaled(
-            current_pixmap.width(), current_pixmap.height(),
-            Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        
-        # Calculate split position
-        split_pos = self.comparison_slider.value() / 100.0
-        split_x = int(current_pixmap.width() * split_pos)
-        
-        # Create comparison image
-        comparison_pixmap = QPixmap(current_pixmap.size())
-        comparison_pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(comparison_pixmap)
-        painter.drawPixmap(0, 0, original_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-        painter.drawPixmap(split_x, 0, 
-                         current_pixmap.copy(split_x, 0, 
-                                           current_pixmap.width() - split_x, 
-                                           current_pixmap.height()))
-        painter.end()
+        # Original pixmap at display size, with the same rotation; rescaled only here,
+        # when the view changes, never on slider moves
+        display_size = self.image_widget.size()
+        original_pixmap = self._scaled_rotated_pixmap(self.original_pixmap, display_size, Qt.KeepAspectRatio)
         
-        # Update labels
-        self.image_label.setPixmap(original_pixmap)
-        self.comparison_label.setPixmap(comparison_pixmap)
+        # Original left of the split, current image right of it, on the one image surface
+        split_percent = self.comparison_slider.value()
+        self.image_widget.set_comparison(original_pixmap, display_size.width() * split_percent // 100)
         
         # Update slider tooltip
-        self.comparison_slider.setToolTip(self.tr("Comparison: %d%%") % int(split_pos * 100))
+        self.comparison_slider.setToolTip(self.tr("Comparison: %d%%") % split_percent)
+
+    def _update_comparison_split(self, split_percent):
+        """Move the comparison split, reusing the already scaled original"""
+        if not self.comparison_mode or self.image_widget.compare_split is None:
+            return
+        self.image_widget.set_comparison(
+            self.image_widget.compare_pixmap, self.image_widget.width() * split_percent // 100)
+        self.comparison_slider.setToolTip(self.tr("Comparison: %d%%") % split_percent)
 
     def start_slideshow(self):
         """Start slideshow of images in current directory."""
@@ -2141,10 +3081,11 @@ class ImageViewer(QMainWindow):
             
         self.is_slideshow_active = True
         self.slideshow_timer.start(self.slideshow_interval)
+        self._prefetch_neighbors()  # Decode the first slides while the current one is shown
         self.slideshow_start_action.setEnabled(False)
         self.slideshow_stop_action.setEnabled(True)
         self.status_bar.showMessage(self.tr("Slideshow started - press Esc to stop"))
-        self.update_actions_state()
+        self._schedule_actions_update()
 
     def stop_slideshow(self):
         """Stop the running slideshow."""
@@ -2153,7 +3094,7 @@ class ImageViewer(QMainWindow):
         self.slideshow_start_action.setEnabled(True)
         self.slideshow_stop_action.setEnabled(False)
         self.status_bar.showMessage(self.tr("Slideshow stopped"))
-        self.update_actions_state()
+        self._schedule_actions_update()
 
     def show_slideshow_settings(self):
         """Show slideshow settings dialog."""
@@ -2181,27 +3122,39 @@ class ImageViewer(QMainWindow):
 
     def _add_to_recent_files(self, file_path):
         """Add a file to the recent files list."""
+        if self.recent_files and self.recent_files[0] == file_path:
+            return
         if file_path in self.recent_files:
             self.recent_files.remove(file_path)
             
         self.recent_files.insert(0, file_path)
         
         # Trim to max recent files
-        if len(self.recent_files) > self.max_recent_files:
-            self.recent_files = self.recent_files[:self.max_recent_files]
+        del self.recent_files[self.max_recent_files:]
             
         self.update_recent_files_menu()
-        
-        # Save to settings
+        self._recent_save_timer.start()
+
+    def _save_recent_files(self):
+        """Write the recent files list to the settings"""
         settings = QSettings()
         settings.setValue("recent_files", self.recent_files)
 
     def update_recent_files_menu(self):
-        """Update the recent files menu with current files."""
+        """Mark the recent files menu for a rebuild the next time it is shown."""
+        self._recent_menu_dirty = True
+
+    def _populate_recent_files_menu(self):
+        """Rebuild the recent files menu if the list changed since it was last shown."""
+        if not self._recent_menu_dirty:
+            return
+        self._recent_menu_dirty = False
+        
+        # Actions are owned by the menu, so clear() deletes the previous ones
         self.recent_menu.clear()
         
         if not self.recent_files:
-            action = QAction(self.tr("No recent files"), self)
+            action = QAction(self.tr("No recent files"), self.recent_menu)
             action.setEnabled(False)
             self.recent_menu.addAction(action)
             return
@@ -2212,14 +3165,20 @@ class ImageViewer(QMainWindow):
             else:
                 text = os.path.basename(file_path)
                 
-            action = QAction(text, self)
+            action = QAction(text, self.recent_menu)
             action.setData(file_path)
-            action.triggered.connect(lambda checked, path=file_path: self._open_recent_file(path))
             self.recent_menu.addAction(action)
         
         self.recent_menu.addSeparator()
         self.recent_menu.addAction(self.clear_recent_action)
 
+    @Slot(QAction)
+    def _on_recent_file_triggered(self, action):
+        """Open the file stored on a triggered recent files entry"""
+        file_path = action.data()
+        if file_path:
+            self._open_recent_file(file_path)
+
     def _open_recent_file(self, file_path=None):
         """Open a file from the recent files list."""
         if file_path is None:
@@ -2228,29 +3187,36 @@ class ImageViewer(QMainWindow):
                 file_path = action.data()
                 
         if file_path and os.path.exists(file_path):
-            self.load_image(file_path)
+            self.load_image_async(file_path)
         else:
             QMessageBox.warning(self, self.tr("File Not Found"), 
                               self.tr("The file '%s' no longer exists.") % file_path)
             self.recent_files.remove(file_path)
             self.update_recent_files_menu()
+            self._recent_save_timer.start()
 
     def clear_recent_files(self):
         """Clear the recent files list."""
         self.recent_files = []
         self.update_recent_files_menu()
-        
-        # Save to settings
-        settings = QSettings()
-        settings.setValue("recent_files", self.recent_files)
+        self._recent_save_timer.start()
 
     def load_language(self, language_code):
         """Load translation for the specified language."""
+        QApplication.removeTranslator(self.translator)
         if language_code == "en":
-            QApplication.removeTranslator(self.translator)
             self.current_language = "en"
         else:
-            if self.translator.load(f":/translations/imageviewer_{language_code}.qm"):
+            translator = self._translators.get(language_code)
+            if translator is None:
+                translator = QTranslator(self)
+                if translator.load(f":/translations/imageviewer_{language_code}.qm"):
+                    self._translators[language_code] = translator
+                else:
+                    translator.deleteLater()
+                    translator = None
+            if translator is not None:
+                self.translator = translator
                 QApplication.installTranslator(self.translator)
                 self.current_language = language_code
             else:
@@ -2260,6 +3226,11 @@ class ImageViewer(QMainWindow):
         # Retranslate UI
         self.retranslateUi()
 
+    @Slot(QAction)
+    def _on_language_triggered(self, action):
+        """Switch to the language code stored on the triggered language action"""
+        self.set_language(action.data())
+
     def set_language(self, language_code):
         """Set application language."""
         if language_code != self.current_language:
@@ -2270,91 +3241,85 @@ class ImageViewer(QMainWindow):
     def retranslateUi(self):
         """Retranslate the UI after language change."""
         # Window title
-        self.setWindowTitle(f"{self.APPLICATION} {self.VERSION}")
         if self.current_image_path:
-            self.setWindowTitle(f"{os.path.basename(self.current_image_path)} - {self.APPLICATION}")
-        
-        # Retranslate all actions
-        self.open_action.setText(self.tr("&Open..."))
-        self.save_action.setText(self.tr("&Save"))
-        self.save_as_action.setText(self.tr("Save &As..."))
-        self.exit_action.setText(self.tr("&Exit"))
-        self.copy_action.setText(self.tr("&Copy Image"))
-        self.remove_bg_action.setText(self.tr("Remove &Background"))
-        self.delete_action.setText(self.tr("&Delete Image"))
-        self.compare_action.setText(self.tr("Compare"))
-        self.zoom_in_action.setText(self.tr("Zoom &In"))
-        self.zoom_out_action.setText(self.tr("Zoom &Out"))
-        self.fit_window_action.setText(self.tr("&Fit to Window"))
-        self.actual_size_action.setText(self.tr("&Actual Size"))
-        self.rotate_left_action.setText(self.tr("Rotate &Left"))
-        self.rotate_right_action.setText(self.tr("Rotate &Right"))
-        self.fullscreen_action.setText(self.tr("&Fullscreen"))
-        self.change_bg_color_action.setText(self.tr("Change &Background Color..."))
-        self.properties_action.setText(self.tr("Image &Properties..."))
-        self.prev_action.setText(self.tr("&Previous Image"))
-        self.next_action.setText(self.tr("&Next Image"))
-        self.first_action.setText(self.tr("&First Image"))
-        self.last_action.setText(self.tr("&Last Image"))
-        self.set_api_key_action.setText(self.tr("Set API &Key..."))
-        self.crop_mode_action.setText(self.tr("&Crop Mode"))
-        self.crop_free_action.setText(self.tr("&Free Crop"))
-        self.crop_1_1_action.setText(self.tr("Crop &1:1 (Square)"))
-        self.crop_4_3_action.setText(self.tr("Crop &4:3"))
-        self.crop_3_2_action.setText(self.tr("Crop &3:2"))
-        self.crop_16_9_action.setText(self.tr("Crop &16:9"))
-        self.crop_custom_action.setText(self.tr("&Custom Ratio..."))
-        self.crop_show_grid_action.setText(self.tr("Show &Grid"))
-        self.crop_show_guides_action.setText(self.tr("Show &Guides"))
-        self.apply_crop_action.setText(self.tr("&Apply Crop"))
-        self.slideshow_start_action.setText(self.tr("Start &Slideshow"))
-        self.slideshow_stop_action.setText(self.tr("Stop Slideshow"))
-        self.slideshow_settings_action.setText(self.tr("Slideshow &Settings..."))
-        self.help_action.setText(self.tr("&Help"))
-        self.about_action.setText(self.tr("&About"))
-        self.about_qt_action.setText(self.tr("About &Qt"))
-        self.clear_recent_action.setText(self.tr("Clear Recent Files"))
+            self.setWindowTitle(f"{self._current_basename} - {self.APPLICATION}")
+        else:
+            self.setWindowTitle(f"{self.APPLICATION} {self.VERSION}")
+        
+        # Retranslate all actions; toolbar buttons take their tooltip from the action
+        for name, _, text, tooltip, _, _ in self.ACTIONS:
+            action = getattr(self, name)
+            action.setText(self.tr(text))
+            tooltip = self.tr(tooltip)
+            if not action.shortcut().isEmpty():
+                tooltip = f"{tooltip} ({action.shortcut().toString()})"
+            action.setToolTip(tooltip)
+        for name, text in self.ACTION_TEXTS:
+            getattr(self, name).setText(self.tr(text))
+        self.update_recent_files_menu()
+        
+        # Status bar words, translated once per language rather than on every display update
+        self._status_labels = {
+            "unsaved": self.tr("Unsaved Image"),
+            "no_bg": self.tr("no bg"),
+            "cropped": self.tr("cropped"),
+            "zoom": self.tr("Zoom"),
+            "rotation": self.tr("Rotation"),
+            "slideshow": self.tr("Slideshow"),
+        }
+        
+        # The help dialog is rebuilt in the new language the next time it is opened
+        if self._help_dialog is not None:
+            self._help_dialog.deleteLater()
+            self._help_dialog = None
         
         # Update status bar
         self._update_status_bar()
 
     def show_help(self):
         """Show application help."""
-        help_text = f"""
-        <h1>{self.APPLICATION} {self.VERSION}</h1>
-        <h2>{self.tr('Keyboard Shortcuts')}</h2>
-        <ul>
-            <li><b>{self.tr('Navigation')}:</b> {self.tr('Left/Right arrows')} - {self.tr('Previous/Next image')}</li>
-            <li><b>{self.tr('Zoom')}:</b> +/- {self.tr('or')} Ctrl+MouseWheel - {self.tr('Zoom in/out')}</li>
-            <li><b>F</b> - {self.tr('Fit to window')}</li>
-            <li><b>Ctrl+0</b> - {self.tr('Actual size')}</li>
-            <li><b>Ctrl+L/R</b> - {self.tr('Rotate left/right')}</li>
-            <li><b>F11</b> - {self.tr('Toggle fullscreen')}</li>
-            <li><b>Ctrl+B</b> - {self.tr('Remove background')}</li>
-            <li><b>Ctrl+Shift+C</b> - {self.tr('Toggle crop mode')}</li>
-            <b>Ctrl+C</b> - {self.tr('Toggle comparison mode')}</li>
-            <li><b>Ctrl+Shift+S</b> - {self.tr('Start slideshow')}</li>
-            <li><b>Esc</b> - {self.tr('Stop slideshow')}</li>
-        </ul>
-        """
-        
-        help_dialog = QDialog(self)
-        help_dialog.setWindowTitle(self.tr("Help"))
-        help_dialog.resize(500, 400)
-        
-        layout = QVBoxLayout(help_dialog)
-        
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
-        text_edit.setHtml(help_text)
-        
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok)
-        button_box.accepted.connect(help_dialog.accept)
-        
-        layout.addWidget(text_edit)
-        layout.addWidget(button_box)
+        # Built once and reused; retranslateUi discards it when the language changes
+        if self._help_dialog is None:
+            help_text = f"""
+            <h1>{self.APPLICATION} {self.VERSION}</h1>
+            <h2>{self.tr('Keyboard Shortcuts')}</h2>
+            <ul>
+                <li><b>{self.tr('Navigation')}:</b> {self.tr('Left/Right arrows')} - {self.tr('Previous/Next image')}</li>
+                <li><b>{self.tr('Zoom')}:</b> +/- {self.tr('or')} Ctrl+MouseWheel - {self.tr('Zoom in/out')}</li>
+                <li><b>F</b> - {self.tr('Fit to window')}</li>
+                <li><b>Ctrl+0</b> - {self.tr('Actual size')}</li>
+                <li><b>Ctrl+L/R</b> - {self.tr('Rotate left/right')}</li>
+                <li><b>F11</b> - {self.tr('Toggle fullscreen')}</li>
+                <li><b>Ctrl+B</b> - {self.tr('Remove background')}</li>
+                <li><b>Ctrl+Shift+C</b> - {self.tr('Toggle crop mode')}</li>
+                <li><b>Ctrl+C</b> - {self.tr('Toggle comparison mode')}</li>
+                <li><b>Ctrl+Shift+S</b> - {self.tr('Start slideshow')}</li>
+                <li><b>Esc</b> - {self.tr('Stop slideshow')}</li>
+            </ul>
+            """
+            
+            help_dialog = QDialog(self)
+            help_dialog.setWindowTitle(self.tr("Help"))
+            help_dialog.resize(500, 400)
+            
+            layout = QVBoxLayout(help_dialog)
+            
+            text_edit = QTextEdit()
+            text_edit.setReadOnly(True)
+            text_edit.setHtml(help_text)
+            
+            button_box = QDialogButtonBox(QDialogButtonBox.Ok)
+            button_box.accepted.connect(help_dialog.accept)
+            
+            layout.addWidget(text_edit)
+            layout.addWidget(button_box)
+            self._help_dialog = help_dialog
         
-        help_dialog.exec()
+        self._help_dialog.exec()
+
+    def show_about_qt(self):
+        """Show the About Qt dialog."""
+        QApplication.aboutQt()
 
     def show_about(self):
         """Show about dialog."""
@@ -2375,59 +3340,54 @@ class ImageViewer(QMainWindow):
         
         QMessageBox.about(self, self.tr("About"), about_text)
 
+    def _schedule_actions_update(self):
+        """Refresh action states once the current burst of state changes is over"""
+        if not self._actions_timer.isActive():
+            self._actions_timer.start()
+
+    def _set_action_enabled(self, action, enabled):
+        """Enable or disable an action, skipping the call when nothing changes"""
+        # Compare with the live state: other code toggles some actions directly
+        if action.isEnabled() != enabled:
+            action.setEnabled(enabled)
+
+    def _has_unsaved_changes(self):
+        """Return True when the shown image differs from the file it came from"""
+        return bool(self.rotation_angle or self.image_modified_by_bg_removal or self.image_modified_by_crop)
+
     def update_actions_state(self):
         """Update enabled/disabled state of actions based on current context."""
         has_image = not self.pixmap.isNull()
         has_multiple_images = len(self.image_files_in_directory) > 1
         has_recent_files = len(self.recent_files) > 0
         
-        # File actions
-        self.save_action.setEnabled(has_image)
-        self.save_as_action.setEnabled(has_image)
-        self.delete_action.setEnabled(has_image)
-        self.properties_action.setEnabled(has_image)
-        
-        # Edit actions
-        self.copy_action.setEnabled(has_image)
-        self.remove_bg_action.setEnabled(has_image and REQUESTS_AVAILABLE and bool(self.remove_bg_api_key))
-        self.compare_action.setEnabled(has_image and 
-                                     (self.image_modified_by_bg_removal or 
-                                      self.image_modified_by_crop or 
-                                      self.rotation_angle != 0))
-        
-        # View actions
-        self.zoom_in_action.setEnabled(has_image)
-        self.zoom_out_action.setEnabled(has_image)
-        self.fit_window_action.setEnabled(has_image)
-        self.actual_size_action.setEnabled(has_image)
-        self.rotate_left_action.setEnabled(has_image)
-        self.rotate_right_action.setEnabled(has_image)
-        self.change_bg_color_action.setEnabled(True)
-        
-        # Navigate actions
-        self.prev_action.setEnabled(has_image and has_multiple_images)
-        self.next_action.setEnabled(has_image and has_multiple_images)
-        self.first_action.setEnabled(has_image and has_multiple_images)
-        self.last_action.setEnabled(has_image and has_multiple_images)
-        
-        # Slideshow actions
-        self.slideshow_start_action.setEnabled(has_image and has_multiple_images)
-        self.slideshow_stop_action.setEnabled(self.is_slideshow_active)
-        
-        # Crop actions
-        self.crop_mode_action.setEnabled(has_image)
-        self.apply_crop_action.setEnabled(has_image and self.is_cropping and 
-                                        not self.crop_overlay.crop_rect.isNull())
+        for name in self.IMAGE_ACTIONS:
+            self._set_action_enabled(getattr(self, name), has_image)
+        can_navigate = has_image and has_multiple_images
+        for name in self.NAVIGATION_ACTIONS:
+            self._set_action_enabled(getattr(self, name), can_navigate)
+        
+        # The remove.bg result replaces the image, so saving waits for it
+        bg_idle = self._bg_reply is None and not self._bg_decoding
+        self._set_action_enabled(self.save_action, has_image and bg_idle)
+        self._set_action_enabled(self.save_as_action, has_image and bg_idle)
+        self._set_action_enabled(self.remove_bg_action, has_image and bool(self.remove_bg_api_key) and bg_idle)
+        self._set_action_enabled(self.compare_action, has_image and self._has_unsaved_changes())
+        
+        self._set_action_enabled(self.change_bg_color_action, True)
+        self._set_action_enabled(self.slideshow_stop_action, self.is_slideshow_active)
+        self._set_action_enabled(self.escape_action, self._bg_reply is not None or self.is_slideshow_active)
+        self._set_action_enabled(self.apply_crop_action, has_image and self.is_cropping and 
+                                 not self.crop_overlay.crop_rect.isNull())
         
         # Recent files menu
-        self.clear_recent_action.setEnabled(has_recent_files)
+        self._set_action_enabled(self.clear_recent_action, has_recent_files)
 
     def resizeEvent(self, event):
         """Handle window resize event to refit image if necessary."""
         super().resizeEvent(event)
-        self.fit_to_window()
-        if self.is_cropping:
-            self.crop_overlay.setGeometry(self.image_label.rect())
+        # Refit once the drag pauses rather than on every intermediate size
+        self._resize_timer.start()
 
     def closeEvent(self, event):
         """Handle window close event."""
@@ -2436,14 +3396,10 @@ class ImageViewer(QMainWindow):
             self.stop_slideshow()
             
         # Check for unsaved changes
-        has_unsaved_changes = (
-            self.rotation_angle != 0 or 
-            self.image_modified_by_bg_removal or 
-            self.image_modified_by_crop
-        )
+        has_unsaved_changes = self._has_unsaved_changes()
         
         if has_unsaved_changes and self.current_image_path:
-            filename = os.path.basename(self.current_image_path)
+            filename = self._current_basename
             reply = QMessageBox.question(
                 self, 
                 self.tr("Unsaved Changes"), 
@@ -2462,20 +3418,39 @@ class ImageViewer(QMainWindow):
                 
         # Save settings
         self._save_settings()
+        self._scan_thread.quit()
+        self._scan_thread.wait()
+        self.cancel_bg_removal()
         event.accept()
 
     def _on_image_loaded(self, file_path):
-        """Handle image loaded signal."""
-        pass  # Could add logging or other side effects here
-
-    def _on_image_saved(self, file_path):
-        """Handle image saved signal."""
-        pass  # Could add logging or other side effects here
-
-    def _on_background_removed(self):
-        """Handle background removed signal."""
-        pass  # Could add logging or other side effects here
-
+        """Parse the new image's EXIF tags in the background for the properties dialog."""
+        key = (self._current_normpath, self._reader_mtime)
+        if PILLOW_AVAILABLE and key not in self._exif_cache:
+            QThreadPool.globalInstance().start(ExifReadTask(key[0], key[1], self._exif_signals))
+
+    def _on_exif_read(self, result):
+        """Store parsed EXIF tags, dropping the oldest files beyond the cache size."""
+        path, mtime, lines = result
+        self._exif_cache[(path, mtime)] = lines
+        self._exif_cache.move_to_end((path, mtime))
+        while len(self._exif_cache) > self.EXIF_CACHE_MAX:
+            self._exif_cache.popitem(last=False)
+
+    def _exif_lines(self, file_path):
+        """Return the EXIF lines of file_path, parsing them now if the background read has not."""
+        if not PILLOW_AVAILABLE:
+            return []
+        path = os.path.normpath(os.path.abspath(file_path))
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return []
+        lines = self._exif_cache.get((path, mtime))
+        if lines is None:
+            lines = _read_exif_lines(path)
+            self._on_exif_read((path, mtime, lines))
+        return lines
 
 if __name__ == '__main__':
     # Create application instance